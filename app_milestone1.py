@@ -2,7 +2,6 @@ import streamlit as st
 import pandas as pd
 import json
 import os
-import tempfile
 from io import BytesIO
 from datetime import datetime
 import plotly.express as px
@@ -912,21 +911,13 @@ def process_uploaded_file(uploaded_file, doc_type):
             # Use real file readers if available
             _, _, _, read_txt, read_docx, read_pdf = modules_or_error
             
-            with tempfile.NamedTemporaryFile(delete=False, suffix=f".{file_extension}") as tmp:
-                tmp.write(file_content)
-                tmp_path = tmp.name
-            
-            try:
-                if file_extension == 'pdf':
-                    text = read_pdf(tmp_path)
-                elif file_extension == 'docx':
-                    text = read_docx(tmp_path)
-                else:
-                    text = "Unsupported file format"
-                    
-            finally:
-                if os.path.exists(tmp_path):
-                    os.unlink(tmp_path)
+            # Readers parse the uploaded bytes directly, no temp file needed
+            if file_extension == 'pdf':
+                text = read_pdf(file_content)
+            elif file_extension == 'docx':
+                text = read_docx(file_content)
+            else:
+                text = "Unsupported file format"
         else:
             # Mock file reading for unsupported formats or when modules unavailable
             text = f"Mock content extracted from {file_name}. This is a sample text with skills like Python, JavaScript, Machine Learning, and Project Management."
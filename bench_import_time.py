@@ -0,0 +1,56 @@
+"""
+Report the cold-start cost of the reader layer.
+
+Each scenario runs in a fresh interpreter. "eager" scenarios also import
+pdfplumber, pypdfium2 and python-docx up front, which is what every
+session paid before the readers loaded their backends on first use; the
+difference is the cold start saved on text-only and API-only paths.
+
+    python bench_import_time.py [--runs 7]
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+
+EAGER = "import pdfplumber, pypdfium2, docx\n"
+
+SCENARIOS = {
+    "text-only": (
+        "import parser_pipeline\n"
+        "parser_pipeline.DocumentParser().process_text_input('Python and SQL developer', 'resume')\n"
+    ),
+    "api-only": "import pipeline, parser_pipeline\n",
+}
+
+TIMER = """
+import time
+_start = time.perf_counter()
+{body}
+print((time.perf_counter() - _start) * 1000)
+"""
+
+
+def time_snippet(body, runs):
+    samples = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", TIMER.format(body=body)],
+                             capture_output=True, text=True, check=True)
+        samples.append(float(out.stdout.strip().splitlines()[-1]))
+    return statistics.median(samples)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--runs", type=int, default=7)
+    args = ap.parse_args()
+
+    print(f"{'scenario':<12}{'lazy ms':>10}{'eager ms':>10}{'saved ms':>10}")
+    for name, body in SCENARIOS.items():
+        lazy = time_snippet(body, args.runs)
+        eager = time_snippet(EAGER + body, args.runs)
+        print(f"{name:<12}{lazy:>10.1f}{eager:>10.1f}{eager - lazy:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
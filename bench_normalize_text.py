@@ -0,0 +1,77 @@
+"""
+Compare normalize_text (ASCII fast path + translate table) with the
+original NFKD-only normalization on a corpus of real documents.
+
+The corpus is the raw text of the bundled resumes and job description, or
+of the given files and directories, repeated up to --mb. It is timed as is
+and folded to ASCII first, to show the fast path on already-ASCII input.
+
+    python bench_normalize_text.py [corpus_dir ...] [--mb 20] [--repeat 3]
+"""
+import argparse
+import os
+import time
+
+from pipeline import read_any
+from preflight import SUPPORTED_EXTENSIONS
+from txt_cleaner import normalize_text, normalize_text_nfkd
+
+SOURCE_FILES = ["Bulli_raju_Resume.txt", "Bulli_raju_Resume.pdf", "Bulli_raju_Resume3.docx",
+                "Raju_job_description.pdf"]
+
+
+def collect_files(sources):
+    files = []
+    for source in sources:
+        if os.path.isdir(source):
+            for root, _, names in os.walk(source):
+                files.extend(os.path.join(root, name) for name in sorted(names)
+                             if os.path.splitext(name)[1].lower() in SUPPORTED_EXTENSIONS)
+        else:
+            files.append(source)
+    return files
+
+
+def build_corpus(files, target_chars):
+    docs = [text for text in (read_any(path) for path in files) if text]
+    if not docs:
+        raise SystemExit("no readable documents")
+    parts = []
+    size = 0
+    while size < target_chars:
+        for doc in docs:
+            parts.append(doc + "\n\n")
+            size += len(doc) + 2
+    return "".join(parts)
+
+
+def best_time(func, text, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("sources", nargs="*", help="documents or directories (default: bundled documents)")
+    ap.add_argument("--mb", type=float, default=20)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    files = collect_files(args.sources or SOURCE_FILES)
+    corpus = build_corpus(files, int(args.mb * 1024 * 1024))
+    non_ascii = sum(1 for c in corpus if ord(c) > 127)
+    print(f"corpus: {len(files)} documents, {len(corpus) / 1e6:.1f}M chars, {non_ascii} non-ASCII")
+    for label, text in [("as read", corpus), ("ascii only", normalize_text_nfkd(corpus))]:
+        old_s = best_time(normalize_text_nfkd, text, args.repeat)
+        new_s = best_time(normalize_text, text, args.repeat)
+        print(f"{label:<12}{'nfkd':<8}{old_s:>8.3f}s  {len(text) / old_s / 1e6:>7.1f} Mchar/s")
+        print(f"{'':<12}{'folded':<8}{new_s:>8.3f}s  {len(text) / new_s / 1e6:>7.1f} Mchar/s  ({old_s / new_s:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
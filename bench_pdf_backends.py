@@ -0,0 +1,127 @@
+"""
+Measure every PDF backend per document class and tune pdf_backend_policy.json.
+
+Each PDF is classified by pdf_backend_policy (producer class, short/long)
+and read with every backend. Quality is the word-level F1 of a backend's
+cleaned text against the "layout" backend's. For each class the fastest
+backend whose worst quality is at least --min-quality is selected.
+
+Runs on the bundled PDFs plus a synthetic long document unless PDFs or
+directories are given. --write stores the selection in the policy file.
+
+    python bench_pdf_backends.py [corpus_dir ...] [--min-quality 0.97] [--write]
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+from collections import Counter, defaultdict
+
+import pypdfium2 as pdfium
+
+import pdf_backend_policy
+from bench_pdf_modes import SOURCE_PDFS, build_corpus
+from file_readers_pdf import PDF_MODES, read_pdf
+from txt_cleaner import normalize_text
+
+REFERENCE = "layout"
+
+
+def word_f1(text, reference):
+    words, ref_words = Counter(normalize_text(text).lower().split()), Counter(normalize_text(reference).lower().split())
+    if not ref_words:
+        return 1.0 if not words else 0.0
+    overlap = sum((words & ref_words).values())
+    if not overlap:
+        return 0.0
+    precision = overlap / sum(words.values())
+    recall = overlap / sum(ref_words.values())
+    return 2 * precision * recall / (precision + recall)
+
+
+def collect_pdfs(sources):
+    paths = []
+    for source in sources:
+        if os.path.isdir(source):
+            for root, _, files in os.walk(source):
+                paths.extend(os.path.join(root, f) for f in sorted(files) if f.lower().endswith(".pdf"))
+        else:
+            paths.append(source)
+    return paths
+
+
+def time_backend(path, mode, repeat):
+    best, text = None, ""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        text = read_pdf(path, workers=1, mode=mode, skip_image_only=False)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, text
+
+
+def group_of(path, policy):
+    pdf = pdfium.PdfDocument(path)
+    try:
+        features = pdf_backend_policy.document_features(pdf)
+    finally:
+        pdf.close()
+    doc_class = pdf_backend_policy.document_class(features, policy)
+    is_long = policy["long_document_pages"] and features["pages"] >= policy["long_document_pages"]
+    return doc_class, "long" if is_long else "short"
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("sources", nargs="*", help="PDF files or directories (default: bundled PDFs)")
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--min-quality", type=float, default=0.97)
+    ap.add_argument("--policy", default=pdf_backend_policy.POLICY_FILE)
+    ap.add_argument("--write", action="store_true", help="write the selected backends to the policy file")
+    args = ap.parse_args()
+
+    policy = pdf_backend_policy.load_policy(args.policy)
+    # group -> mode -> list of (seconds, quality)
+    results = defaultdict(lambda: defaultdict(list))
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = collect_pdfs(args.sources) if args.sources else SOURCE_PDFS + build_corpus(tmp, [30])
+        print(f"{'document':<28}{'class':<18}" + "".join(f"{m + ' s':>11}{'F1':>6}" for m in PDF_MODES))
+        for path in paths:
+            group = group_of(path, policy)
+            reference = None
+            row = f"{os.path.basename(path)[:27]:<28}{'/'.join(group):<18}"
+            for mode in (REFERENCE,) + tuple(m for m in PDF_MODES if m != REFERENCE):
+                seconds, text = time_backend(path, mode, args.repeat)
+                if reference is None:
+                    reference = text
+                quality = word_f1(text, reference)
+                results[group][mode].append((seconds, quality))
+            for mode in PDF_MODES:
+                seconds, quality = results[group][mode][-1]
+                row += f"{seconds:>11.3f}{quality:>6.2f}"
+            print(row)
+
+    print()
+    print(f"{'class':<18}{'backend':<10}{'mean s':>8}{'min F1':>8}")
+    modes, long_modes = dict(policy["modes"]), dict(policy["long_modes"])
+    for (doc_class, length), by_mode in sorted(results.items()):
+        good = [(sum(s for s, _ in runs) / len(runs), mode) for mode, runs in by_mode.items()
+                if min(q for _, q in runs) >= args.min_quality]
+        seconds, mode = min(good)
+        worst = min(q for _, q in by_mode[mode])
+        print(f"{doc_class + '/' + length:<18}{mode:<10}{seconds:>8.3f}{worst:>8.2f}")
+        (long_modes if length == "long" else modes)[doc_class] = mode
+
+    if args.write:
+        policy = dict(policy, modes=modes, long_modes=long_modes)
+        tmp_path = args.policy + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(policy, f, indent=2)
+            f.write("\n")
+        os.replace(tmp_path, args.policy)
+        print(f"\nWrote {args.policy}")
+
+
+if __name__ == "__main__":
+    main()
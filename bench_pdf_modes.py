@@ -0,0 +1,83 @@
+"""
+Compare read_pdf's "layout" and "fast" modes for speed and skill recall.
+
+Runs on the bundled Bulli_raju_Resume.pdf and a synthetic corpus built by
+concatenating the pages of the bundled PDFs into longer documents. Recall
+is the share of skills found in the layout-mode text that are also found
+in the fast-mode text.
+
+    python bench_pdf_modes.py [--repeat 3] [--sizes 1 5 20 50]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import pypdfium2 as pdfium
+
+from file_readers_pdf import read_pdf
+from txt_cleaner import normalize_text
+from remove_personal import remove_personal
+
+SKILLS_FILE = "skills_list.txt"
+SOURCE_PDFS = ["Bulli_raju_Resume.pdf", "Raju_job_description.pdf"]
+
+
+def build_corpus(out_dir, sizes):
+    """Write one synthetic PDF per requested page count and return their paths."""
+    sources = [pdfium.PdfDocument(p) for p in SOURCE_PDFS]
+    paths = []
+    for n_pages in sizes:
+        doc = pdfium.PdfDocument.new()
+        i = 0
+        while len(doc) < n_pages:
+            src = sources[i % len(sources)]
+            doc.import_pages(src, pages=list(range(min(len(src), n_pages - len(doc)))))
+            i += 1
+        path = os.path.join(out_dir, f"synthetic_{n_pages}p.pdf")
+        doc.save(path)
+        doc.close()
+        paths.append(path)
+    for src in sources:
+        src.close()
+    return paths
+
+
+def time_mode(path, mode, repeat):
+    best = None
+    text = ""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        text = read_pdf(path, workers=1, mode=mode)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, text
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--sizes", type=int, nargs="+", default=[1, 5, 20, 50])
+    args = ap.parse_args()
+
+    # Imported here because it loads the spaCy model at import time
+    from skill_extractor import extract_skills
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = ["Bulli_raju_Resume.pdf"] + build_corpus(tmp, args.sizes)
+        print(f"{'document':<24}{'layout s':>10}{'fast s':>10}{'speedup':>9}{'recall':>8}")
+        for path in paths:
+            timings = {}
+            skills = {}
+            for mode in ("layout", "fast"):
+                timings[mode], text = time_mode(path, mode, args.repeat)
+                skills[mode] = set(extract_skills(normalize_text(remove_personal(text)), SKILLS_FILE))
+            reference = skills["layout"]
+            recall = len(reference & skills["fast"]) / len(reference) if reference else 1.0
+            speedup = timings["layout"] / timings["fast"] if timings["fast"] else float("inf")
+            print(f"{os.path.basename(path):<24}{timings['layout']:>10.3f}{timings['fast']:>10.3f}"
+                  f"{speedup:>8.1f}x{recall:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
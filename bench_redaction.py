@@ -0,0 +1,70 @@
+"""
+Compare remove_personal (single-output redaction cascade) with the original
+four re.sub passes on a large synthetic corpus.
+
+The corpus repeats the bundled resume with varied emails, URLs, phone
+numbers and dates spliced in. Outputs are checked for equality.
+
+    python bench_redaction.py [--mb 20] [--repeat 3]
+"""
+import argparse
+import random
+import time
+
+from remove_personal import remove_personal, remove_personal_sequential
+
+PII = [
+    "{n}.dev{i}@mail.com", "https://github.com/user{i}", "www.site{i}.org", "+91 98765 {i:05d}",
+    "555-{i:03d}-4567", "0{m}/20{y}", "20{y}-0{m}-1{m}", "Jan {m}, 20{y}", "September 1{m} 20{y}",
+]
+
+
+def build_corpus(target_bytes, seed=0):
+    with open("Bulli_raju_Resume.txt", "r", encoding="utf-8") as f:
+        base = f.read().split()
+    rng = random.Random(seed)
+    parts = []
+    size = 0
+    i = 0
+    while size < target_bytes:
+        words = list(base)
+        for _ in range(20):
+            template = rng.choice(PII)
+            words.insert(rng.randrange(len(words)),
+                         template.format(n=rng.choice("abcxyz"), i=i, m=rng.randint(1, 9), y=rng.randint(10, 25)))
+            i += 1
+        doc = " ".join(words) + "\n\n"
+        parts.append(doc)
+        size += len(doc)
+    return "".join(parts)
+
+
+def best_time(func, text, repeat):
+    best, out = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out = func(text)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, out
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--mb", type=float, default=20)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    text = build_corpus(int(args.mb * 1024 * 1024))
+    print(f"corpus: {len(text) / 1e6:.1f}M chars")
+    old_s, old = best_time(remove_personal_sequential, text, args.repeat)
+    new_s, new = best_time(remove_personal, text, args.repeat)
+    print(f"{'sequential':<12}{old_s:>8.3f}s  {len(text) / old_s / 1e6:>6.1f} Mchar/s")
+    print(f"{'cascade':<12}{new_s:>8.3f}s  {len(text) / new_s / 1e6:>6.1f} Mchar/s  ({old_s / new_s:.2f}x)")
+    print("identical output:", old == new)
+    if old != new:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
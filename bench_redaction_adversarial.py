@@ -0,0 +1,85 @@
+"""
+Check that remove_personal runs in linear time on adversarial input.
+
+Each generator builds inputs of doubling size n from patterns that make
+backtracking regexes blow up (long tokens, '@' chains, spreadsheet-like
+digit/dash/space tables, repeated month names) plus random fragment
+mixes. For every generator the time for the largest input is compared
+with the smallest: if it grows more than --max-exponent (log-log slope)
+the script exits with status 1.
+
+    python bench_redaction_adversarial.py [--sizes 16384 32768 65536 131072] [--legacy]
+"""
+import argparse
+import math
+import random
+import time
+
+from remove_personal import remove_personal, remove_personal_sequential
+
+_FRAGMENTS = ["a", "@", ".", "a@b.c", "http", "www.", "1", "12", "-", " ", "\t", "\n", "/", "+", "Jan", ","]
+
+
+def _random_mix(n):
+    rng = random.Random(n)
+    return "".join(rng.choice(_FRAGMENTS) for _ in range(n))[:n]
+
+
+GENERATORS = {
+    "long_token": lambda n: "a" * n,
+    "at_chain": lambda n: ("a@" * n)[:n],
+    "at_dotless": lambda n: ("x@" + "a" * 50 + " ") * (n // 53),
+    "digit_table": lambda n: ("12 - 3 - 45 -\t6 " * n)[:n],
+    "dash_run": lambda n: "1" + "- " * (n // 2),
+    "plus_run": lambda n: ("+1-" * n)[:n],
+    "months": lambda n: ("Jan " * n)[:n],
+    "slashes": lambda n: ("12/" * n)[:n],
+    "random": _random_mix,
+}
+
+
+def best_time(func, text, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--sizes", type=int, nargs="+", default=[16384, 32768, 65536, 131072])
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--max-exponent", type=float, default=1.3,
+                    help="fail if time grows faster than n ** max_exponent")
+    ap.add_argument("--legacy", action="store_true",
+                    help="also time the original re.sub passes (slow: quadratic on some inputs)")
+    args = ap.parse_args()
+
+    funcs = [("remove_personal", remove_personal)]
+    if args.legacy:
+        funcs.append(("sequential", remove_personal_sequential))
+    sizes = sorted(args.sizes)
+    print(f"{'input':<14}{'function':<18}" + "".join(f"{n:>10}" for n in sizes) + f"{'exponent':>10}")
+    failed = []
+    for name, generate in GENERATORS.items():
+        texts = [generate(n) for n in sizes]
+        for func_name, func in funcs:
+            times = [best_time(func, text, args.repeat) for text in texts]
+            # Floor the small end so timer noise on microsecond runs isn't read as growth
+            low = max(times[0], 1e-5)
+            exponent = math.log(max(times[-1], low) / low) / math.log(len(texts[-1]) / len(texts[0]))
+            print(f"{name:<14}{func_name:<18}" + "".join(f"{t * 1000:>9.2f}m" for t in times)
+                  + f"{exponent:>10.2f}")
+            if func is remove_personal and exponent > args.max_exponent:
+                failed.append(name)
+    if failed:
+        print("superlinear:", ", ".join(failed))
+        raise SystemExit(1)
+    print("all inputs linear")
+
+
+if __name__ == "__main__":
+    main()
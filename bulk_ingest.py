@@ -0,0 +1,398 @@
+"""
+Bulk ingestion: read_any + remove_personal + normalize_text over many files.
+ZIP and TAR archives are read member by member without extracting to disk.
+
+    python bulk_ingest.py resumes/ more/cv.pdf batch.zip --workers 8 --out cleaned/
+"""
+import argparse
+import hashlib
+import os
+import re
+import sys
+import tarfile
+import time
+import zipfile
+import zlib
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from pipeline import read_any
+from file_readers_pdf import is_image_only_pdf
+from txt_cleaner import normalize_text
+from remove_personal import remove_personal
+from supervised_worker import SupervisedPool, OK
+from near_duplicates import NearDuplicateIndex
+from preflight import preflight, PreflightError, TOO_LARGE
+
+SUPPORTED_EXTENSIONS = ('.txt', '.docx', '.pdf')
+ARCHIVE_SUFFIXES = ('.zip', '.tar', '.tgz', '.tar.gz', '.tar.bz2', '.tar.xz')
+
+
+@dataclass
+class IngestResult:
+    """Outcome of ingesting a single document"""
+    path: str
+    # "ok", "empty", "error", "needs_ocr" (scanned PDF without a text layer),
+    # "rejected" (failed the preflight checks, see preflight.py),
+    # or a limit status from supervised_worker: "timeout", "too_large" or "crashed"
+    status: str
+    cleaned_text: str = ""
+    raw_chars: int = 0
+    error: str = ""
+    seconds: float = 0.0
+    # Set when the document is a near-duplicate of an earlier one
+    duplicate_of: str = ""
+    similarity: float = 0.0
+    # Output of the ingestor's `analyze` callback (e.g. extracted skills)
+    analysis: Any = None
+
+    @property
+    def success(self) -> bool:
+        return self.status == "ok"
+
+    def to_dict(self) -> Dict:
+        return {
+            'path': self.path,
+            'status': self.status,
+            'raw_chars': self.raw_chars,
+            'cleaned_chars': len(self.cleaned_text),
+            'error': self.error,
+            'seconds': self.seconds,
+            'duplicate_of': self.duplicate_of,
+            'similarity': self.similarity,
+        }
+
+
+@dataclass
+class IngestReport:
+    """Running totals for a bulk ingestion run"""
+    total: int = 0
+    counts: Dict[str, int] = field(default_factory=dict)
+    started: float = field(default_factory=time.perf_counter)
+    elapsed: float = 0.0
+    duplicates: int = 0
+    analyzed: int = 0
+    analysis_seconds: float = 0.0
+
+    def add(self, result: IngestResult):
+        self.total += 1
+        self.counts[result.status] = self.counts.get(result.status, 0) + 1
+        if result.duplicate_of:
+            self.duplicates += 1
+        self.elapsed = time.perf_counter() - self.started
+
+    @property
+    def analysis_seconds_saved(self) -> float:
+        # Duplicates skip analysis; estimate what they would have cost
+        if not self.analyzed:
+            return 0.0
+        return self.duplicates * self.analysis_seconds / self.analyzed
+
+    @property
+    def docs_per_sec(self) -> float:
+        return self.total / self.elapsed if self.elapsed > 0 else 0.0
+
+    def summary(self) -> str:
+        counts = ", ".join(f"{k}={v}" for k, v in sorted(self.counts.items()))
+        text = f"{self.total} docs in {self.elapsed:.2f}s ({self.docs_per_sec:.1f} docs/sec; {counts})"
+        if self.duplicates:
+            text += f"\n{self.duplicates} near-duplicates reused earlier results"
+            if self.analyzed:
+                text += f", skipping ~{self.analysis_seconds_saved:.2f}s of analysis"
+        return text
+
+
+def is_supported(name: str) -> bool:
+    return os.path.splitext(name)[1].lower() in SUPPORTED_EXTENSIONS
+
+
+def is_archive(name: str) -> bool:
+    return name.lower().endswith(ARCHIVE_SUFFIXES)
+
+
+def collect_paths(sources: Iterable[str]) -> List[str]:
+    """Expand directories (recursively) into the supported files and archives they contain"""
+    paths = []
+    for source in sources:
+        if os.path.isdir(source):
+            for root, _, files in os.walk(source):
+                for name in sorted(files):
+                    if is_supported(name) or is_archive(name):
+                        paths.append(os.path.join(root, name))
+        else:
+            paths.append(source)
+    return paths
+
+
+def _error_text(e: Exception) -> str:
+    return f"{type(e).__name__}: {e}"
+
+
+def iter_archive_members(path: str, max_bytes: Optional[int] = None
+                         ) -> Iterator[Tuple[str, Optional[bytes], Optional[str]]]:
+    """
+    Yield (member_name, data, error) for each supported document in a ZIP or
+    TAR archive, reading one member at a time. Members larger than
+    `max_bytes` are yielded with data=None instead of being read. A member
+    that can't be read (corrupt data, encryption, an unsupported compression
+    method) is yielded with data=None and the error, and reading goes on
+    with the next member.
+    """
+    limit = max_bytes + 1 if max_bytes else -1
+    if path.lower().endswith('.zip'):
+        with zipfile.ZipFile(path) as zf:
+            for info in zf.infolist():
+                if info.is_dir() or not is_supported(info.filename):
+                    continue
+                if max_bytes and info.file_size > max_bytes:
+                    yield info.filename, None, None
+                    continue
+                try:
+                    with zf.open(info) as member:
+                        data = member.read(limit)
+                except Exception as e:
+                    yield info.filename, None, _error_text(e)
+                    continue
+                yield info.filename, (None if max_bytes and len(data) > max_bytes else data), None
+    else:
+        # Stream mode: members are read in order, no seeking back
+        with tarfile.open(path, 'r|*') as tf:
+            for info in tf:
+                if not info.isfile() or not is_supported(info.name):
+                    continue
+                if max_bytes and info.size > max_bytes:
+                    yield info.name, None, None
+                    continue
+                try:
+                    data = tf.extractfile(info).read(limit)
+                except Exception as e:
+                    yield info.name, None, _error_text(e)
+                    continue
+                yield info.name, (None if max_bytes and len(data) > max_bytes else data), None
+
+
+def ingest_file(path: str, data: Optional[bytes] = None, preflighted: bool = False) -> IngestResult:
+    """
+    Read and clean one file, or in-memory `data` named `path`; runs inside a
+    worker process. preflighted=True skips the preflight checks the caller
+    has already run.
+    """
+    start = time.perf_counter()
+    source = path if data is None else data
+    try:
+        if path.lower().endswith('.pdf') and is_image_only_pdf(source):
+            return IngestResult(path, "needs_ocr", seconds=time.perf_counter() - start)
+        # The pool already provides the parallelism, keep PDFs serial; the
+        # scanned-PDF check above is not repeated inside read_pdf
+        raw = read_any(source, file_name=path, pdf_workers=1, pdf_mode="auto",
+                       pdf_skip_image_only=False, preflighted=preflighted)
+        if not raw.strip():
+            return IngestResult(path, "empty", seconds=time.perf_counter() - start)
+        cleaned = normalize_text(remove_personal(raw))
+        return IngestResult(path, "ok", cleaned, len(raw), seconds=time.perf_counter() - start)
+    except PreflightError as e:
+        return IngestResult(path, "rejected", error=str(e), seconds=time.perf_counter() - start)
+    except Exception as e:
+        return IngestResult(path, "error", error=_error_text(e),
+                            seconds=time.perf_counter() - start)
+
+
+def _ingest_job(job: Tuple[str, Optional[bytes]]) -> IngestResult:
+    # BulkIngestor._jobs only hands out files that passed preflight
+    return ingest_file(*job, preflighted=True)
+
+
+class BulkIngestor:
+    """
+    Dispatches ingest_file over a pool of supervised worker processes and
+    yields results in completion order. At most `max_in_flight` documents
+    are submitted at a time, so memory does not grow with the input list.
+
+    Each document runs under `timeout` seconds and `max_memory_mb` of extra
+    memory; a worker that overruns is killed and replaced and the document
+    comes back as "timeout", "too_large" or "crashed". Files bigger than
+    `max_file_mb` are reported as "too_large" without being opened, and
+    files failing the preflight checks (wrong magic bytes, truncated) as
+    "rejected" without reaching a worker.
+
+    Archive members are passed to the workers as bytes, reported under
+    "<archive>!<member>"; the in-flight cap also bounds how many members
+    are held in memory at once.
+
+    Cleaned documents are checked against `dedup` (a NearDuplicateIndex).
+    `analyze(cleaned_text)`, e.g. skill extraction, runs in this process
+    for original documents only; near-duplicates get the earlier
+    document's analysis and `duplicate_of` instead.
+    """
+
+    def __init__(self, workers: Optional[int] = None, max_in_flight: Optional[int] = None,
+                 timeout: Optional[float] = 120, max_memory_mb: Optional[int] = 1024,
+                 max_file_mb: Optional[float] = 50, dedup: Optional[NearDuplicateIndex] = None,
+                 analyze: Optional[Callable[[str], Any]] = None):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_in_flight = max_in_flight or self.workers * 4
+        self.timeout = timeout
+        self.max_memory_mb = max_memory_mb
+        self.max_file_mb = max_file_mb
+        self.dedup = dedup
+        self.analyze = analyze
+        self._analyses: Dict[str, Any] = {}
+        self.report = IngestReport()
+
+    @property
+    def max_file_bytes(self) -> Optional[int]:
+        return int(self.max_file_mb * 1024 * 1024) if self.max_file_mb else None
+
+    def _too_large(self, path: str) -> IngestResult:
+        return IngestResult(path, "too_large", error=f"file larger than {self.max_file_mb}MB")
+
+    def _preflight(self, path: str, data: Optional[bytes] = None) -> Optional[IngestResult]:
+        # Runs in this process, so workers only ever see files that passed
+        try:
+            preflight(path if data is None else data, path, self.max_file_bytes)
+        except PreflightError as e:
+            if e.reason == TOO_LARGE:
+                return self._too_large(path)
+            return IngestResult(path, "rejected", error=str(e))
+        return None
+
+    def _jobs(self, paths: Iterable[str], rejected: List[IngestResult]) -> Iterator[Tuple[str, Optional[bytes]]]:
+        for path in paths:
+            if not is_archive(path):
+                failed = self._preflight(path)
+                if failed is not None:
+                    rejected.append(failed)
+                else:
+                    yield path, None
+                continue
+            try:
+                for name, data, error in iter_archive_members(path, self.max_file_bytes):
+                    label = f"{path}!{name}"
+                    if error is not None:
+                        failed = IngestResult(label, "error", error=error)
+                    elif data is None:
+                        failed = self._too_large(label)
+                    else:
+                        failed = self._preflight(label, data)
+                    if failed is not None:
+                        rejected.append(failed)
+                    else:
+                        yield label, data
+            except (OSError, EOFError, zlib.error, zipfile.BadZipFile, tarfile.TarError) as e:
+                # The archive itself is unreadable (bad directory, a corrupt
+                # compressed TAR stream); members yielded so far are kept
+                rejected.append(IngestResult(path, "error", error=_error_text(e)))
+
+    def _post_process(self, result: IngestResult):
+        if not result.success:
+            return
+        if self.dedup is not None:
+            match = self.dedup.check_and_add(result.path, result.cleaned_text)
+            if match is not None:
+                result.duplicate_of, result.similarity = match
+                result.analysis = self._analyses.get(result.duplicate_of)
+                return
+        if self.analyze is not None:
+            start = time.perf_counter()
+            result.analysis = self.analyze(result.cleaned_text)
+            self.report.analyzed += 1
+            self.report.analysis_seconds += time.perf_counter() - start
+            self._analyses[result.path] = result.analysis
+
+    def run(self, sources: Iterable[str]) -> Iterator[IngestResult]:
+        self.report = IngestReport()
+        rejected = []
+        jobs = self._jobs(collect_paths(sources), rejected)
+        with SupervisedPool(self.workers, self.timeout, self.max_memory_mb) as pool:
+            for (path, _), status, value in pool.map_unordered(_ingest_job, jobs, self.max_in_flight):
+                while rejected:
+                    result = rejected.pop()
+                    self.report.add(result)
+                    yield result
+                if status == OK:
+                    result = value
+                    self._post_process(result)
+                else:
+                    result = IngestResult(path, status, error=value)
+                self.report.add(result)
+                yield result
+        for result in rejected:
+            self.report.add(result)
+            yield result
+
+
+_UNSAFE_NAME_CHARS = re.compile(r'[^\w.-]+')
+
+
+def cleaned_name(path: str) -> str:
+    """
+    Output file name for a document: its base name (archive member name
+    for "<archive>!<member>") with the extension kept, plus a hash of the
+    full path, so x.pdf and x.txt, or two x.pdf in different folders or
+    archives, don't overwrite each other.
+    """
+    member = path
+    bang = path.find('!')
+    while bang >= 0:
+        if is_archive(path[:bang]):
+            member = path[bang + 1:]
+            break
+        bang = path.find('!', bang + 1)
+    base = _UNSAFE_NAME_CHARS.sub('_', member.replace('\\', '/').rsplit('/', 1)[-1])
+    digest = hashlib.sha1(path.encode('utf-8')).hexdigest()[:8]
+    return f"cleaned_{base}_{digest}.txt"
+
+
+def write_cleaned(result: IngestResult, out_dir: str) -> str:
+    out_path = os.path.join(out_dir, cleaned_name(result.path))
+    with open(out_path, "w", encoding="utf-8") as f:
+        f.write(result.cleaned_text)
+    return out_path
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Bulk-ingest resumes and job descriptions")
+    ap.add_argument("sources", nargs="+", help="files or directories to ingest")
+    ap.add_argument("--workers", type=int, default=None)
+    ap.add_argument("--out", default=None, help="directory for cleaned_<name>.<ext>_<hash>.txt files")
+    ap.add_argument("--timeout", type=float, default=120, help="seconds allowed per document")
+    ap.add_argument("--max-memory-mb", type=int, default=1024, help="extra memory allowed per document")
+    ap.add_argument("--max-file-mb", type=float, default=50, help="larger files are rejected unread")
+    ap.add_argument("--dedup-threshold", type=float, default=0.9,
+                    help="MinHash similarity above which a document reuses an earlier result (0 disables)")
+    ap.add_argument("--skills", default=None, help="skills list file; extract skills for each original document")
+    ap.add_argument("--ocr-queue", default=None, help="append scanned PDFs that need OCR to this file")
+    args = ap.parse_args(argv)
+
+    if args.out:
+        os.makedirs(args.out, exist_ok=True)
+
+    analyze = None
+    if args.skills:
+        # Loads the spaCy model, so only when asked for
+        from skill_extractor import extract_skills
+        analyze = lambda text: extract_skills(text, args.skills)
+
+    dedup = NearDuplicateIndex(args.dedup_threshold) if args.dedup_threshold > 0 else None
+    ingestor = BulkIngestor(workers=args.workers, timeout=args.timeout,
+                            max_memory_mb=args.max_memory_mb, max_file_mb=args.max_file_mb,
+                            dedup=dedup, analyze=analyze)
+    for result in ingestor.run(args.sources):
+        line = f"[{result.status}] {result.path} ({result.seconds:.2f}s)"
+        if result.duplicate_of:
+            line += f" duplicate of {result.duplicate_of} ({result.similarity:.2f})"
+        if result.error:
+            line += f" {result.error}"
+        print(line)
+        if args.out and result.success:
+            write_cleaned(result, args.out)
+        if args.ocr_queue and result.status == "needs_ocr":
+            with open(args.ocr_queue, "a", encoding="utf-8") as f:
+                f.write(result.path + "\n")
+
+    print(ingestor.report.summary())
+    return 0 if ingestor.report.counts.get("error", 0) == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,100 @@
-from docx import Document
+import io
+import zipfile
+import xml.etree.ElementTree as ET
 
-def read_docx(file_path):
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+MC_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+
+# "xml" stream-parses the package parts directly, "python-docx" builds the
+# full Document object model and only sees body paragraphs
+DOCX_ENGINES = ("xml", "python-docx")
+
+def _as_source(file_path):
+    if isinstance(file_path, (bytes, bytearray, memoryview)):
+        return io.BytesIO(file_path)
+    return file_path
+
+def _iter_part_paragraphs(stream):
+    """
+    Yield paragraph texts from one WordprocessingML part as it is parsed.
+    Paragraphs inside table cells and text boxes come out where they sit in
+    the document, and finished elements are cleared to keep memory flat.
+    """
+    # Paragraphs can nest (a text box inside a paragraph), so keep a stack
+    open_paragraphs = []
+    in_fallback = 0
+    # w:tab inside paragraph properties is a tab stop definition, not text
+    in_properties = 0
+    for event, elem in ET.iterparse(stream, events=("start", "end")):
+        tag = elem.tag
+        if tag == MC_FALLBACK:
+            # Fallback repeats the text box content of the matching Choice
+            in_fallback += 1 if event == "start" else -1
+            continue
+        if in_fallback:
+            if event == "end":
+                elem.clear()
+            continue
+        if tag == W_NS + "pPr":
+            in_properties += 1 if event == "start" else -1
+            continue
+        if event == "start":
+            if tag == W_NS + "p":
+                open_paragraphs.append([])
+            continue
+        if not open_paragraphs or in_properties:
+            continue
+        if tag == W_NS + "t":
+            if elem.text:
+                open_paragraphs[-1].append(elem.text)
+        elif tag == W_NS + "tab":
+            open_paragraphs[-1].append("\t")
+        elif tag in (W_NS + "br", W_NS + "cr"):
+            open_paragraphs[-1].append("\n")
+        elif tag == W_NS + "p":
+            text = "".join(open_paragraphs.pop())
+            elem.clear()
+            if text.strip():
+                yield text
+
+def _part_order(names):
+    headers = sorted(n for n in names if n.startswith("word/header") and n.endswith(".xml"))
+    footers = sorted(n for n in names if n.startswith("word/footer") and n.endswith(".xml"))
+    return headers + ["word/document.xml"] + footers
+
+def iter_docx_xml_paragraphs(file_path):
+    """
+    Stream paragraph texts straight out of the .docx zip: headers, then the
+    body (including tables and text boxes), then footers.
+    """
+    with zipfile.ZipFile(_as_source(file_path)) as zf:
+        names = set(zf.namelist())
+        for name in _part_order(names):
+            if name not in names:
+                continue
+            with zf.open(name) as part:
+                yield from _iter_part_paragraphs(part)
+
+def iter_docx_paragraphs(file_path, engine="xml"):
+    """
+    Yield the text of each non-empty paragraph in document order.
+    file_path may also be bytes, a memoryview or a binary file-like object.
+    """
+    if engine not in DOCX_ENGINES:
+        raise ValueError(f"Unknown docx engine: {engine}")
+    if engine == "xml":
+        yield from iter_docx_xml_paragraphs(file_path)
+        return
+    # python-docx is only imported when this engine is asked for
+    from docx import Document
+    doc = Document(_as_source(file_path))
+    for p in doc.paragraphs:
+        if p.text.strip():
+            yield p.text
+
+def read_docx(file_path, engine="xml"):
     try:
-        doc = Document(file_path)
-        return "\n".join([p.text for p in doc.paragraphs if p.text.strip()])
+        return "\n".join(iter_docx_paragraphs(file_path, engine))
     except Exception as e:
         print("Error reading docx:", e)
         return ""
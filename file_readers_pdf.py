@@ -1,12 +1,289 @@
-import pdfplumber
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
 
-def read_pdf(file_path):
+# PDFs with fewer pages than this are read serially, starting a process
+# pool costs more than it saves on a one or two page resume.
+PARALLEL_MIN_PAGES = 8
+
+# "layout" runs pdfplumber's character and layout analysis, "fast" reads the
+# text layer through pdfium (already installed as a pdfplumber dependency)
+# and "pdfminer" runs pdfminer's layout analysis without pdfplumber's
+# per-character objects. mode="auto" picks one per document, see
+# pdf_backend_policy.py
+PDF_MODES = ("layout", "fast", "pdfminer")
+
+# read_pdf_budgeted always keeps this many leading pages (name, summary)
+BUDGET_HEAD_PAGES = 2
+
+
+def _pdfplumber():
+    # Backends are imported on first use: pdfplumber pulls in pdfminer and
+    # Pillow, which text-only and API-only sessions never need
+    import pdfplumber
+    return pdfplumber
+
+
+def _pdfium():
+    import pypdfium2
+    return pypdfium2
+
+
+def _as_source(source):
+    # Paths and file-like objects are opened as-is, raw bytes are read from memory
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return io.BytesIO(source)
+    return source
+
+
+def _as_worker_source(source):
+    # Worker processes need something picklable: a path or the raw bytes
+    if isinstance(source, (str, os.PathLike)):
+        return source
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return bytes(source)
+    source.seek(0)
+    return source.read()
+
+
+def _page_texts(pages):
+    # Release each page's parsed objects before moving on to the next one
+    for p in pages:
+        text = p.extract_text() or ""
+        p.close()
+        yield text
+
+
+def _fast_page_texts(pdf, start, stop):
+    for i in range(start, stop):
+        page = pdf[i]
+        textpage = page.get_textpage()
+        text = textpage.get_text_range()
+        textpage.close()
+        page.close()
+        # pdfium uses CRLF line ends and U+FFFE for a hyphen at a line break
+        yield text.replace("\r\n", "\n").replace("\ufffe", "-")
+
+
+def _miner_page_texts(source, page_numbers=None):
+    from pdfminer.high_level import extract_pages
+    from pdfminer.layout import LTTextContainer
+    for layout in extract_pages(source, page_numbers=page_numbers):
+        yield "".join(element.get_text() for element in layout if isinstance(element, LTTextContainer))
+
+
+def _check_mode(mode):
+    if mode not in PDF_MODES and mode != "auto":
+        raise ValueError(f"Unknown pdf mode: {mode}")
+
+
+def _resolve_mode(source, mode):
+    if mode != "auto":
+        return mode
+    from pdf_backend_policy import choose_mode, document_features
+    pdf = _pdfium().PdfDocument(source)
+    try:
+        return choose_mode(document_features(pdf))
+    finally:
+        pdf.close()
+
+
+def _read_pages(source, page_numbers, mode):
+    # Text of the given (sorted) pages, opening the document once
+    if mode == "fast":
+        pdf = _pdfium().PdfDocument(source)
+        try:
+            return [text for i in page_numbers for text in _fast_page_texts(pdf, i, i + 1)]
+        finally:
+            pdf.close()
+    if mode == "pdfminer":
+        return list(_miner_page_texts(source, page_numbers))
+    with _pdfplumber().open(source) as pdf:
+        return list(_page_texts(pdf.pages[i] for i in page_numbers))
+
+
+def _read_page_range(source, start, stop, mode="layout"):
+    # Runs inside a worker process, so each worker opens the file itself
+    return _read_pages(_as_source(source), range(start, stop), mode)
+
+
+def _page_ranges(n_pages, workers):
+    step = -(-n_pages // workers)
+    return [(start, min(start + step, n_pages)) for start in range(0, n_pages, step)]
+
+
+def _count_pages(source, mode):
+    if mode != "layout":
+        pdf = _pdfium().PdfDocument(source)
+        try:
+            return len(pdf)
+        finally:
+            pdf.close()
+    with _pdfplumber().open(source) as pdf:
+        return len(pdf.pages)
+
+
+def _probe_indices(n_pages, probe_pages):
+    # Every page, or `probe_pages` pages spread evenly from the first to the last
+    if probe_pages is None or probe_pages >= n_pages:
+        return range(n_pages)
+    if probe_pages <= 1:
+        return range(min(probe_pages, n_pages))
+    step = (n_pages - 1) / (probe_pages - 1)
+    return sorted({round(k * step) for k in range(probe_pages)})
+
+
+def is_image_only_pdf(file_path, probe_pages=None):
+    """
+    Cheap scanned-document check: True when no page has a text layer but
+    at least one carries an image. Stops at the first page with text, so a
+    scanned cover page in front of a text resume costs one extra page.
+    `probe_pages` limits the check to that many pages spread across the
+    document (first and last included) when a guess is good enough.
+    Only pdfium's object/character counts are read, no text is extracted.
+    """
+    pdfium = _pdfium()
+    pdf = pdfium.PdfDocument(_as_source(file_path))
+    try:
+        has_images = False
+        for i in _probe_indices(len(pdf), probe_pages):
+            page = pdf[i]
+            textpage = page.get_textpage()
+            n_chars = textpage.count_chars()
+            textpage.close()
+            if n_chars > 0:
+                page.close()
+                return False
+            if not has_images:
+                has_images = any(True for _ in page.get_objects(filter=(pdfium.raw.FPDF_PAGEOBJ_IMAGE,)))
+            page.close()
+        return has_images
+    finally:
+        pdf.close()
+
+
+def iter_pdf_pages(file_path, mode="layout"):
+    """
+    Yield the text of each page in order. Each page's parsed objects are
+    released before the next page is read, so memory stays bounded by the
+    largest single page rather than the whole document.
+
+    file_path may also be bytes, a memoryview or a binary file-like object.
+    """
+    _check_mode(mode)
+    file_path = _as_source(file_path)
+    mode = _resolve_mode(file_path, mode)
+    if mode == "pdfminer":
+        yield from _miner_page_texts(file_path)
+        return
+    if mode == "fast":
+        pdf = _pdfium().PdfDocument(file_path)
+        try:
+            yield from _fast_page_texts(pdf, 0, len(pdf))
+        finally:
+            pdf.close()
+        return
+    with _pdfplumber().open(file_path) as pdf:
+        yield from _page_texts(pdf.pages)
+
+
+def read_pdf(file_path, workers=None, parallel_min_pages=PARALLEL_MIN_PAGES, mode="layout",
+             skip_image_only=True):
+    """
+    Extract the text of every page, joined with newlines in page order.
+    file_path may also be bytes, a memoryview or a binary file-like object
+    (e.g. a Streamlit upload), which is parsed without touching the disk.
+
+    mode="fast" skips pdfplumber's per-character layout analysis and reads
+    the text layer directly, see bench_pdf_modes.py for the speed/recall
+    trade-off. mode="auto" chooses a backend from the document's producer,
+    page count and text object density (pdf_backend_policy.py).
+
+    Documents with at least `parallel_min_pages` pages are split into
+    contiguous page ranges and extracted across a process pool of
+    `workers` processes (defaults to the CPU count). Pass workers=1 to
+    always stay serial.
+
+    Scanned PDFs, where no page has a text layer, are detected up front
+    with is_image_only_pdf and return "" without running page extraction.
+    Pass skip_image_only=False when the caller has already checked.
+    """
+    _check_mode(mode)
     text_pages = []
     try:
-        with pdfplumber.open(file_path) as pdf:
-            for p in pdf.pages:
-                text_pages.append(p.extract_text() or "")
+        source = _as_source(file_path)
+        if skip_image_only and is_image_only_pdf(source):
+            print("PDF has no text layer (scanned?), needs OCR")
+            return ""
+        mode = _resolve_mode(source, mode)
+        n_pages = _count_pages(source, mode)
+        workers = min(workers or os.cpu_count() or 1, n_pages)
+        if workers <= 1 or n_pages < parallel_min_pages:
+            return "\n".join(iter_pdf_pages(source, mode))
+
+        source = _as_worker_source(source)
+        ranges = _page_ranges(n_pages, workers)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_read_page_range, source, start, stop, mode) for start, stop in ranges]
+            for future in futures:
+                text_pages.extend(future.result())
         return "\n".join(text_pages)
     except Exception as e:
         print("Error reading pdf:", e)
         return ""
+
+
+def _select_pages(fast_texts, max_pages, max_chars, head_pages, is_key_page):
+    # Leading pages first, then pages carrying a section header in document
+    # order, until either the page or the (estimated) character budget is spent
+    selected = list(range(min(head_pages, max_pages, len(fast_texts))))
+    used = sum(len(fast_texts[i]) for i in selected)
+    if is_key_page is not None:
+        for i in range(len(selected), len(fast_texts)):
+            if len(selected) >= max_pages or (max_chars and used >= max_chars):
+                break
+            if is_key_page(fast_texts[i]):
+                selected.append(i)
+                used += len(fast_texts[i])
+    return selected
+
+
+def read_pdf_budgeted(file_path, max_pages, max_chars=None, is_key_page=None, mode="layout",
+                      head_pages=BUDGET_HEAD_PAGES, skip_image_only=True):
+    """
+    Like read_pdf, but bounded by an extraction budget for very long
+    documents (portfolios, publication lists).
+
+    A document with at most `max_pages` pages is read as usual. Longer ones
+    get a cheap first pass over the pdfium text layer; the first
+    `head_pages` pages plus the pages for which is_key_page(page_text) is
+    true are then fully extracted, up to `max_pages` pages in total. The
+    result is cut to `max_chars` characters. skip_image_only works as in
+    read_pdf.
+    """
+    _check_mode(mode)
+    try:
+        source = _as_source(file_path)
+        if skip_image_only and is_image_only_pdf(source):
+            print("PDF has no text layer (scanned?), needs OCR")
+            return ""
+        mode = _resolve_mode(source, mode)
+        pdf = _pdfium().PdfDocument(source)
+        try:
+            n_pages = len(pdf)
+            fast_texts = list(_fast_page_texts(pdf, 0, n_pages)) if n_pages > max_pages else None
+        finally:
+            pdf.close()
+
+        if fast_texts is None:
+            text = read_pdf(source, workers=1, mode=mode, skip_image_only=False)
+        else:
+            selected = _select_pages(fast_texts, max_pages, max_chars, head_pages, is_key_page)
+            if mode == "fast":
+                text = "\n".join(fast_texts[i] for i in selected)
+            else:
+                text = "\n".join(_read_pages(source, selected, mode))
+        return text[:max_chars] if max_chars else text
+    except Exception as e:
+        print("Error reading pdf:", e)
+        return ""
@@ -1,10 +1,154 @@
-def read_txt(file_path):
+import codecs
+import io
+import mmap
+
+# Size of each chunk yielded by iter_txt_chunks, in bytes
+CHUNK_SIZE = 64 * 1024
+
+# How much of the file is inspected to pick the encoding
+SNIFF_SIZE = 4096
+
+# Checked in order: the UTF-32 LE BOM starts with the UTF-16 LE one
+BOMS = [
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+]
+
+def sniff_encoding(prefix):
+    """
+    Return (encoding, errors) for a file starting with `prefix`, from its BOM
+    or NUL byte layout. Plain UTF-8 comes back with errors='strict': a file
+    that turns out not to be UTF-8 is decoded as latin-1 as a whole, like
+    the original open(..., encoding='utf-8') with a latin-1 retry.
+    """
+    for bom, encoding in BOMS:
+        if prefix.startswith(bom):
+            return encoding, 'replace'
+    # BOM-less UTF-16 puts a NUL in every other byte of ASCII text
+    if len(prefix) >= 4:
+        even_nuls = prefix[0::2].count(0)
+        odd_nuls = prefix[1::2].count(0)
+        half = len(prefix) // 2
+        if odd_nuls > 0.3 * half and even_nuls == 0:
+            return 'utf-16-le', 'replace'
+        if even_nuls > 0.3 * half and odd_nuls == 0:
+            return 'utf-16-be', 'replace'
+    return 'utf-8', 'strict'
+
+def _is_utf8(buf, chunk_size):
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    try:
+        for start in range(0, len(buf), chunk_size):
+            chunk = bytes(buf[start:start + chunk_size])
+            # ASCII chunks can't be invalid, unless they finish a sequence
+            if not (chunk.isascii() and not decoder.getstate()[0]):
+                decoder.decode(chunk)
+        decoder.decode(b'', final=True)
+    except UnicodeDecodeError:
+        return False
+    return True
+
+def _iter_decoded(buf, chunk_size):
+    # buf is anything sliceable to bytes: an mmap or a bytes-like object
+    encoding, errors = sniff_encoding(bytes(buf[:SNIFF_SIZE]))
+    if errors == 'strict' and not _is_utf8(buf, chunk_size):
+        encoding = 'latin-1'
+    # Text-mode newlines: '\r\n' and '\r' become '\n', also across chunks
+    decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder(encoding)(errors=errors),
+                                           translate=True)
+    for start in range(0, len(buf), chunk_size):
+        text = decoder.decode(buf[start:start + chunk_size])
+        if text:
+            yield text
+    text = decoder.decode(b'', final=True)
+    if text:
+        yield text
+
+def _iter_file_chunks(file_path, chunk_size):
+    with open(file_path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Empty files, pipes and devices can't be mapped
+            yield from _iter_decoded(f.read(), chunk_size)
+            return
+        try:
+            yield from _iter_decoded(mm, chunk_size)
+        finally:
+            mm.close()
+
+def iter_txt_chunks(file_path, chunk_size=CHUNK_SIZE):
+    """
+    Yield the file's text in chunks of roughly `chunk_size` bytes.
+    Files are memory-mapped, the encoding is sniffed once from the first
+    bytes (BOM, UTF-16 layout, otherwise UTF-8, or latin-1 for the whole
+    file if it isn't valid UTF-8, which takes one extra validating pass) and
+    the content is decoded incrementally with text-mode newlines, so only
+    one chunk is held at a time.
+    file_path may also be bytes, a memoryview or a binary file-like object.
+    """
+    if isinstance(file_path, (bytes, bytearray, memoryview)):
+        yield from _iter_decoded(memoryview(file_path).cast('B'), chunk_size)
+    elif hasattr(file_path, 'read'):
+        yield from _iter_decoded(file_path.read(), chunk_size)
+    else:
+        yield from _iter_file_chunks(file_path, chunk_size)
+
+def iter_txt_lines(file_path, chunk_size=CHUNK_SIZE):
+    """Yield lines (without line endings) without loading the whole file."""
+    pending = ''
+    for chunk in iter_txt_chunks(file_path, chunk_size):
+        lines = (pending + chunk).splitlines(keepends=True)
+        # Hold back the last line: it may continue in the next chunk, or end
+        # in a '\r' whose '\n' starts the next chunk
+        pending = lines.pop() if lines else ''
+        for line in lines:
+            yield line.splitlines()[0]
+    if pending:
+        yield pending.splitlines()[0]
+
+def iter_txt_paragraphs(file_path, chunk_size=CHUNK_SIZE):
+    """Yield blank-line separated blocks (e.g. one posting per block in a JD dump)."""
+    block = []
+    for line in iter_txt_lines(file_path, chunk_size):
+        if line.strip():
+            block.append(line)
+        elif block:
+            yield '\n'.join(block)
+            block = []
+    if block:
+        yield '\n'.join(block)
+
+def _decode(data):
+    encoding, errors = sniff_encoding(bytes(data[:SNIFF_SIZE]))
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return f.read()
+        text = str(data, encoding, errors)
     except UnicodeDecodeError:
-        with open(file_path, 'r', encoding='latin-1') as f:
-            return f.read()
+        text = str(data, 'latin-1')
+    # Same newlines as reading the file in text mode
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+def read_txt(file_path):
+    """Read a text file; file_path may also be bytes, a memoryview or a binary file-like object."""
+    if isinstance(file_path, (bytes, bytearray, memoryview)):
+        return _decode(file_path)
+    if hasattr(file_path, 'read'):
+        return _decode(file_path.read())
+    try:
+        with open(file_path, 'rb') as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                return _decode(f.read())
+            try:
+                return _decode(mm)
+            finally:
+                mm.close()
     except FileNotFoundError:
         print("File not found:", file_path)
         return ""
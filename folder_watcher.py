@@ -0,0 +1,206 @@
+"""
+Watch a drop folder and ingest only new or changed documents.
+
+A JSON manifest records (size, mtime, content hash, pipeline version) for
+every processed file. Unchanged files are skipped from a stat() alone, a
+touched file is only re-ingested if its hash changed, and bumping
+PARSER_VERSION re-processes everything. Files that failed for a reason
+that may not happen again (error, timeout, crash) are retried with an
+exponential backoff. The manifest survives restarts.
+
+    python folder_watcher.py inbox/ --out cleaned/ --interval 30
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from typing import Dict, Iterator, List, Optional
+
+from bulk_ingest import BulkIngestor, IngestResult, collect_paths, write_cleaned
+from parser_pipeline import PARSER_VERSION
+
+MANIFEST_NAME = ".skillgap_manifest.json"
+
+# The manifest is rewritten after this many results, and at the end of a scan
+SAVE_EVERY = 50
+
+# Statuses that may not repeat on the same content; the other statuses
+# ("ok", "empty", "rejected", "needs_ocr", "too_large") are kept until the
+# file changes. The n-th retry waits RETRY_BASE_SECONDS * 2 ** (n - 1),
+# at most RETRY_MAX_SECONDS.
+RETRY_STATUSES = ("error", "timeout", "crashed")
+RETRY_BASE_SECONDS = 60
+RETRY_MAX_SECONDS = 3600
+
+
+def file_sha256(path: str, chunk_size: int = 1024 * 1024) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class Manifest:
+    """Processed-file records, persisted as JSON and written atomically"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.files: Dict[str, Dict] = {}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                self.files = json.load(f).get("files", {})
+        except FileNotFoundError:
+            pass
+        except ValueError as e:
+            print(f"Ignoring unreadable manifest {path}: {e}")
+
+    def is_current(self, path: str, stat: os.stat_result, now: Optional[float] = None) -> bool:
+        entry = self.files.get(path)
+        return (entry is not None
+                and entry["size"] == stat.st_size
+                and entry["mtime_ns"] == stat.st_mtime_ns
+                and entry["pipeline_version"] == PARSER_VERSION
+                and not self.retry_due(path, now))
+
+    def retry_due(self, path: str, now: Optional[float] = None) -> bool:
+        """True if the file's last run failed transiently and its backoff has passed"""
+        entry = self.files.get(path)
+        if entry is None or entry["status"] not in RETRY_STATUSES:
+            return False
+        return (time.time() if now is None else now) >= entry.get("retry_after", 0)
+
+    def record(self, path: str, stat: os.stat_result, sha256: str, status: str, now: Optional[float] = None):
+        entry = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": sha256,
+            "pipeline_version": PARSER_VERSION,
+            "status": status,
+        }
+        if status in RETRY_STATUSES:
+            previous = self.files.get(path)
+            attempts = 1
+            if previous and previous["sha256"] == sha256 and previous["status"] in RETRY_STATUSES:
+                attempts = previous.get("attempts", 1) + 1
+            delay = min(RETRY_BASE_SECONDS * 2 ** (attempts - 1), RETRY_MAX_SECONDS)
+            entry["attempts"] = attempts
+            entry["retry_after"] = (time.time() if now is None else now) + delay
+        self.files[path] = entry
+
+    def touch(self, path: str, stat: os.stat_result):
+        """Refresh the stat fields of a file whose content did not change"""
+        self.files[path]["size"] = stat.st_size
+        self.files[path]["mtime_ns"] = stat.st_mtime_ns
+
+    def forget_missing(self, present: set):
+        for path in [p for p in self.files if p not in present]:
+            del self.files[path]
+
+    def save(self):
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"files": self.files}, f)
+        os.replace(tmp_path, self.path)
+
+
+class FolderWatcher:
+    """
+    Polls `folder` and runs new or changed files through BulkIngestor.
+    Files modified less than `settle_seconds` ago are left for the next
+    scan, so half-copied uploads aren't ingested.
+    """
+
+    def __init__(self, folder: str, ingestor: BulkIngestor, manifest_path: Optional[str] = None,
+                 settle_seconds: float = 2.0):
+        self.folder = folder
+        self.ingestor = ingestor
+        self.manifest = Manifest(manifest_path or os.path.join(folder, MANIFEST_NAME))
+        self.settle_seconds = settle_seconds
+
+    def _changed_files(self) -> Dict[str, Dict]:
+        changed = {}
+        present = set()
+        now = time.time()
+        for path in collect_paths([self.folder]):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            present.add(path)
+            if self.manifest.is_current(path, stat, now) or now - stat.st_mtime < self.settle_seconds:
+                continue
+            sha256 = file_sha256(path)
+            entry = self.manifest.files.get(path)
+            if (entry and entry["sha256"] == sha256 and entry["pipeline_version"] == PARSER_VERSION
+                    and not self.manifest.retry_due(path, now)):
+                # Touched but not modified: refresh the stat fields only
+                self.manifest.touch(path, stat)
+                continue
+            changed[path] = {"stat": stat, "sha256": sha256}
+        self.manifest.forget_missing(present)
+        return changed
+
+    def scan_once(self) -> Iterator[IngestResult]:
+        """Ingest everything new or changed since the last scan"""
+        changed = self._changed_files()
+        member_statuses: Dict[str, List[str]] = {}
+        unsaved = 0
+        for result in self.ingestor.run(list(changed)):
+            if result.path in changed:
+                info = changed[result.path]
+                self.manifest.record(result.path, info["stat"], info["sha256"], result.status)
+            else:
+                # Archive members are reported as "<archive>!<member>"
+                member_statuses.setdefault(result.path.split("!", 1)[0], []).append(result.status)
+            unsaved += 1
+            if unsaved >= SAVE_EVERY:
+                self.manifest.save()
+                unsaved = 0
+            yield result
+        for path, info in changed.items():
+            if path in member_statuses or self.manifest.files.get(path, {}).get("sha256") != info["sha256"]:
+                statuses = member_statuses.get(path, [])
+                # A member that failed transiently gets the whole archive retried
+                retry = [status for status in statuses if status in RETRY_STATUSES]
+                if retry:
+                    status = retry[0]
+                else:
+                    status = "ok" if "ok" in statuses else (statuses[0] if statuses else "empty")
+                self.manifest.record(path, info["stat"], info["sha256"], status)
+        self.manifest.save()
+
+    def watch(self, interval: float = 10.0) -> Iterator[IngestResult]:
+        while True:
+            yield from self.scan_once()
+            time.sleep(interval)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Ingest new or changed files from a drop folder")
+    ap.add_argument("folder")
+    ap.add_argument("--out", required=True, help="directory for cleaned_<name>.<ext>_<hash>.txt files")
+    ap.add_argument("--manifest", default=None, help=f"manifest path (default: <folder>/{MANIFEST_NAME})")
+    ap.add_argument("--interval", type=float, default=10.0, help="seconds between scans")
+    ap.add_argument("--once", action="store_true", help="scan once and exit")
+    ap.add_argument("--workers", type=int, default=None)
+    args = ap.parse_args(argv)
+
+    os.makedirs(args.out, exist_ok=True)
+    ingestor = BulkIngestor(workers=args.workers)
+    watcher = FolderWatcher(args.folder, ingestor, args.manifest)
+    results = watcher.scan_once() if args.once else watcher.watch(args.interval)
+    try:
+        for result in results:
+            print(f"[{result.status}] {result.path}")
+            if result.success:
+                write_cleaned(result, args.out)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
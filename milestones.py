@@ -44,7 +44,7 @@ import plotly.express as px
 # Import custom modules
 # from pipeline import DocumentParser, get_parser
 # from txt_cleaner import TextCleaner
-from parser_pipeline import DocumentParser, get_parser
+from parser_pipeline import DocumentParser, DocumentLimitError, NeedsOCRError, PreflightError, get_parser
 from file_readers_txt import read_txt
 from file_readers_docx import read_docx
 from file_readers_pdf import read_pdf
@@ -2516,9 +2516,15 @@ def process_documents(parser, resume_file, job_file, resume_text, job_text):
         time.sleep(0.3)
         
         if resume_file:
-            file_path = parser.save_uploaded_file(resume_file)
-            raw, cleaned, _ = parser.extract_text_auto(file_path)
-            results['resume'] = {'raw': raw, 'cleaned': cleaned}
+            try:
+                raw, cleaned, _ = parser.extract_uploaded_file(resume_file)
+                results['resume'] = {'raw': raw, 'cleaned': cleaned}
+            except NeedsOCRError:
+                st.warning("⚠️ The resume PDF is a scanned image without a text layer. Run it through OCR or paste the text.", icon="⚠️")
+            except DocumentLimitError as e:
+                st.error(f"❌ Could not parse the resume ({e.status.replace('_', ' ')}). Try a smaller file or paste the text.", icon="❌")
+            except PreflightError as e:
+                st.error(f"❌ The resume file was rejected ({e}). Upload a valid PDF, DOCX or TXT file or paste the text.", icon="❌")
         elif resume_text:
             raw, cleaned, _ = parser.process_text_input(resume_text, "resume")
             results['resume'] = {'raw': raw, 'cleaned': cleaned}
@@ -2530,9 +2536,15 @@ def process_documents(parser, resume_file, job_file, resume_text, job_text):
         time.sleep(0.3)
         
         if job_file:
-            file_path = parser.save_uploaded_file(job_file)
-            raw, cleaned, _ = parser.extract_text_auto(file_path)
-            results['job'] = {'raw': raw, 'cleaned': cleaned}
+            try:
+                raw, cleaned, _ = parser.extract_uploaded_file(job_file)
+                results['job'] = {'raw': raw, 'cleaned': cleaned}
+            except NeedsOCRError:
+                st.warning("⚠️ The job description PDF is a scanned image without a text layer. Run it through OCR or paste the text.", icon="⚠️")
+            except DocumentLimitError as e:
+                st.error(f"❌ Could not parse the job description ({e.status.replace('_', ' ')}). Try a smaller file or paste the text.", icon="❌")
+            except PreflightError as e:
+                st.error(f"❌ The job description file was rejected ({e}). Upload a valid PDF, DOCX or TXT file or paste the text.", icon="❌")
         elif job_text:
             raw, cleaned, _ = parser.process_text_input(job_text, "job_description")
             results['job'] = {'raw': raw, 'cleaned': cleaned}
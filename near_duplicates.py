@@ -0,0 +1,110 @@
+"""
+MinHash / LSH near-duplicate detection for cleaned documents.
+
+Re-submitted resumes usually differ by a date, a phone number or a
+reworded line. Comparing word shingles with MinHash catches those so the
+expensive spaCy / SBERT analysis of the earlier copy can be reused.
+"""
+import hashlib
+import zlib
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Mersenne prime 2^31 - 1: a * x + b stays below 2^63 for 31-bit a, b, x
+_PRIME = (1 << 31) - 1
+
+# Shingle hashes are permuted this many at a time and folded into the
+# signature, so the num_perm x block intermediate stays around 2MB
+SIGNATURE_BLOCK = 2048
+
+
+def shingles(text: str, size: int = 5) -> set:
+    """Set of `size`-word shingles of the lowercased text"""
+    words = text.lower().split()
+    if len(words) <= size:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def _choose_bands(num_perm: int, threshold: float) -> Tuple[int, int]:
+    # Pick bands * rows == num_perm whose LSH S-curve midpoint
+    # (1 / bands) ** (1 / rows) is closest to the threshold
+    best = None
+    for bands in range(1, num_perm + 1):
+        if num_perm % bands:
+            continue
+        rows = num_perm // bands
+        error = abs((1 / bands) ** (1 / rows) - threshold)
+        if best is None or error < best[0]:
+            best = (error, bands, rows)
+    return best[1], best[2]
+
+
+class NearDuplicateIndex:
+    """
+    Remembers documents by MinHash signature and finds earlier documents
+    whose estimated Jaccard similarity is at least `threshold`.
+    """
+
+    def __init__(self, threshold: float = 0.9, num_perm: int = 128, shingle_size: int = 5, seed: int = 1):
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.bands, self.rows = _choose_bands(num_perm, threshold)
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, _PRIME, size=(num_perm, 1)).astype(np.uint64)
+        self._b = rng.randint(0, _PRIME, size=(num_perm, 1)).astype(np.uint64)
+        self._buckets: List[Dict[bytes, List[str]]] = [defaultdict(list) for _ in range(self.bands)]
+        self._signatures: Dict[str, np.ndarray] = {}
+        self._exact: Dict[str, str] = {}
+
+    def signature(self, text: str) -> np.ndarray:
+        grams = shingles(text, self.shingle_size)
+        hashes = np.fromiter((zlib.crc32(g.encode("utf-8")) & _PRIME for g in grams),
+                             dtype=np.uint64, count=len(grams))
+        signature = np.full(self.num_perm, _PRIME, dtype=np.uint64)
+        for start in range(0, len(hashes), SIGNATURE_BLOCK):
+            block = hashes[start:start + SIGNATURE_BLOCK]
+            np.minimum(signature, ((self._a * block + self._b) % _PRIME).min(axis=1), out=signature)
+        return signature
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [signature[i * self.rows:(i + 1) * self.rows].tobytes() for i in range(self.bands)]
+
+    def find(self, text: str, signature: Optional[np.ndarray] = None) -> Optional[Tuple[str, float]]:
+        """Return (doc_id, similarity) of the most similar indexed document, if above the threshold"""
+        exact = self._exact.get(hashlib.sha1(text.encode("utf-8")).hexdigest())
+        if exact is not None:
+            return exact, 1.0
+        if signature is None:
+            signature = self.signature(text)
+        candidates = set()
+        for band, key in enumerate(self._band_keys(signature)):
+            candidates.update(self._buckets[band].get(key, ()))
+        best = None
+        for doc_id in candidates:
+            similarity = float(np.mean(self._signatures[doc_id] == signature))
+            if similarity >= self.threshold and (best is None or similarity > best[1]):
+                best = (doc_id, similarity)
+        return best
+
+    def add(self, doc_id: str, text: str, signature: Optional[np.ndarray] = None):
+        if signature is None:
+            signature = self.signature(text)
+        self._exact.setdefault(hashlib.sha1(text.encode("utf-8")).hexdigest(), doc_id)
+        self._signatures[doc_id] = signature
+        for band, key in enumerate(self._band_keys(signature)):
+            self._buckets[band][key].append(doc_id)
+
+    def check_and_add(self, doc_id: str, text: str) -> Optional[Tuple[str, float]]:
+        """Return the earlier near-duplicate of `text`, or index it as a new original"""
+        signature = self.signature(text)
+        match = self.find(text, signature)
+        if match is None:
+            self.add(doc_id, text, signature)
+        return match
+
+    def __len__(self) -> int:
+        return len(self._signatures)
@@ -0,0 +1,143 @@
+"""
+Map character positions in cleaned text back to the text it came from.
+
+A cleaning step that replaces spans of its input describes itself as a
+list of edits, (start, end, replacement) in input positions. apply_edits
+returns the output together with an OffsetMap: the output as alternating
+runs of copied text and replacements, run-length encoded as
+
+    (clean_start, orig_start, clean_len, orig_len, copied)
+
+so the map is as long as the number of edits, not the text. A position
+inside a copied run maps to the same character of the original; a
+position inside a replacement maps to the start (or, for the end of a
+span, the end) of the text it replaced. Lookups bisect the runs, and maps
+of consecutive steps compose into a single map.
+"""
+from bisect import bisect_left, bisect_right
+from typing import Iterable, List, Sequence, Tuple
+
+Edit = Tuple[int, int, str]
+Segment = Tuple[int, int, int, int, bool]
+
+
+class OffsetMap:
+    """Run-length encoded map from cleaned positions to original positions"""
+
+    def __init__(self, segments: Sequence[Segment], clean_length: int, orig_length: int):
+        self.segments = list(segments)
+        self.clean_length = clean_length
+        self.orig_length = orig_length
+        self._clean_starts = [segment[0] for segment in self.segments]
+
+    @classmethod
+    def identity(cls, length: int) -> "OffsetMap":
+        return cls([(0, 0, length, length, True)] if length else [], length, length)
+
+    def to_original(self, pos: int, end: bool = False) -> int:
+        """
+        Original position of cleaned position `pos`. With end=True `pos` is
+        taken as the end of a span, so a position on the boundary between
+        two runs maps through the run before it.
+        """
+        if not 0 <= pos <= self.clean_length:
+            raise IndexError(f"position {pos} outside 0..{self.clean_length}")
+        if not self.segments:
+            return 0 if not end else self.orig_length
+        if end:
+            index = max(bisect_left(self._clean_starts, pos) - 1, 0)
+        else:
+            index = min(bisect_right(self._clean_starts, pos) - 1, len(self.segments) - 1)
+        clean_start, orig_start, clean_len, orig_len, copied = self.segments[index]
+        if copied:
+            return orig_start + min(pos - clean_start, orig_len)
+        if (end and pos > clean_start) or pos >= clean_start + clean_len:
+            return orig_start + orig_len
+        return orig_start
+
+    def span_to_original(self, start: int, end: int) -> Tuple[int, int]:
+        """Original (start, end) of the cleaned span start:end"""
+        orig_start = self.to_original(start)
+        return orig_start, max(orig_start, self.to_original(end, end=True))
+
+    def compose(self, later: "OffsetMap") -> "OffsetMap":
+        """
+        Map for running this step and then `later` on its output: takes
+        positions in the output of `later` to positions in this map's
+        original text.
+        """
+        if later.orig_length != self.clean_length:
+            raise ValueError(f"cannot compose: step output has {self.clean_length} characters, "
+                             f"next step input has {later.orig_length}")
+        builder = _SegmentBuilder()
+        for clean_start, mid_start, clean_len, mid_len, copied in later.segments:
+            if not copied:
+                orig_start, orig_end = self.span_to_original(mid_start, mid_start + mid_len)
+                builder.add(clean_len, orig_end - orig_start, False, orig_start)
+                continue
+            pos, mid_end = mid_start, mid_start + mid_len
+            index = max(bisect_right(self._clean_starts, pos) - 1, 0)
+            while pos < mid_end:
+                seg_clean, seg_orig, seg_clean_len, seg_orig_len, seg_copied = self.segments[index]
+                piece_end = min(mid_end, seg_clean + seg_clean_len)
+                if seg_copied:
+                    builder.add(piece_end - pos, piece_end - pos, True, seg_orig + pos - seg_clean)
+                else:
+                    # A replacement is only split when `later` copies part of
+                    # it: the piece at its start takes the whole original span
+                    orig_len = seg_orig_len if pos == seg_clean else 0
+                    orig_at = seg_orig if orig_len else seg_orig + seg_orig_len
+                    builder.add(piece_end - pos, orig_len, False, orig_at)
+                pos = piece_end
+                index += 1
+        return OffsetMap(builder.segments, later.clean_length, self.orig_length)
+
+    def __len__(self):
+        return len(self.segments)
+
+    def __repr__(self):
+        return f"OffsetMap({len(self.segments)} runs, {self.clean_length} <- {self.orig_length} chars)"
+
+
+class _SegmentBuilder:
+    """Appends runs left to right, merging neighbours of the same kind"""
+
+    def __init__(self):
+        self.segments: List[Segment] = []
+        self.clean_pos = 0
+
+    def add(self, clean_len: int, orig_len: int, copied: bool, orig_start: int):
+        if clean_len == 0 and orig_len == 0:
+            return
+        if self.segments:
+            last_clean, last_orig, last_clean_len, last_orig_len, last_copied = self.segments[-1]
+            if last_copied == copied and (not copied or last_orig + last_orig_len == orig_start):
+                # Neighbouring replacements become one replacing everything they span
+                orig_end = max(last_orig + last_orig_len, orig_start + orig_len)
+                self.segments[-1] = (last_clean, last_orig, last_clean_len + clean_len,
+                                     orig_end - last_orig, copied)
+                self.clean_pos += clean_len
+                return
+        self.segments.append((self.clean_pos, orig_start, clean_len, orig_len, copied))
+        self.clean_pos += clean_len
+
+
+def apply_edits(text: str, edits: Iterable[Edit]) -> Tuple[str, OffsetMap]:
+    """
+    Apply sorted, non-overlapping (start, end, replacement) edits to text.
+    Returns the edited text and the OffsetMap back to `text`.
+    """
+    parts = []
+    builder = _SegmentBuilder()
+    pos = 0
+    for start, end, replacement in edits:
+        if start > pos:
+            parts.append(text[pos:start])
+            builder.add(start - pos, start - pos, True, pos)
+        parts.append(replacement)
+        builder.add(len(replacement), end - start, False, start)
+        pos = end
+    if pos < len(text):
+        parts.append(text[pos:])
+        builder.add(len(text) - pos, len(text) - pos, True, pos)
+    return "".join(parts), OffsetMap(builder.segments, builder.clean_pos, len(text))
@@ -0,0 +1,204 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+# Entries hold the raw text, personal data included, so the disk tier is
+# opt-in: get_default_cache() only writes to disk when this variable names
+# a directory. DEFAULT_CACHE_DIR is the suggested per-user location.
+CACHE_DIR_ENV = "SKILLGAP_PARSE_CACHE_DIR"
+DEFAULT_CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+                                 "skillgap", "parse_cache")
+
+
+def _private_dir(path: str) -> Optional[str]:
+    """Create `path` readable by the current user only, None if that can't be ensured"""
+    try:
+        os.makedirs(path, mode=0o700, exist_ok=True)
+        if hasattr(os, "getuid"):
+            if os.stat(path).st_uid != os.getuid():
+                print("Parse cache directory is owned by another user, not using it:", path)
+                return None
+            os.chmod(path, 0o700)
+    except OSError as e:
+        print("Error creating parse cache directory:", e)
+        return None
+    return path
+
+
+class ParseCache:
+    """
+    Content-addressed cache of parsed documents.
+
+    Entries are keyed by a hash of the file bytes plus the parser version and
+    hold the (raw_text, cleaned_text, ext) tuple returned by DocumentParser.
+    Recently used entries live in memory (LRU, capped by `max_memory_bytes`).
+    With a `cache_dir` every entry is also written to disk, capped by
+    `max_disk_bytes`, so repeat documents survive a process restart. The
+    directory is created private to the current user (0700, files 0600)
+    and the disk tier is turned off if it is owned by someone else.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None,
+                 max_memory_bytes: int = 64 * 1024 * 1024,
+                 max_disk_bytes: int = 512 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()
+        self._memory_bytes = 0
+        # Estimate of the on-disk size, only rescanned once it passes the cap
+        self._disk_bytes = None
+        self._lock = threading.Lock()
+        if cache_dir:
+            self.cache_dir = _private_dir(cache_dir)
+
+    @staticmethod
+    def make_key(data, version: str) -> str:
+        """Hash file content (bytes or memoryview) together with the parser version"""
+        h = hashlib.sha256(data)
+        h.update(b"\0" + version.encode("utf-8"))
+        return h.hexdigest()
+
+    @staticmethod
+    def _entry_size(entry: Tuple[str, str, str]) -> int:
+        return sum(len(part) for part in entry)
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + ".json")
+
+    def get(self, key: str) -> Optional[Tuple[str, str, str]]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return entry
+
+        entry = self._read_disk(key)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.disk_hits += 1
+            self._remember(key, entry)
+        return entry
+
+    def put(self, key: str, entry: Tuple[str, str, str]):
+        entry = tuple(entry)
+        with self._lock:
+            self._remember(key, entry)
+        self._write_disk(key, entry)
+
+    def _remember(self, key: str, entry: Tuple[str, str, str]):
+        # Caller holds the lock
+        old = self._memory.pop(key, None)
+        if old is not None:
+            self._memory_bytes -= self._entry_size(old)
+        size = self._entry_size(entry)
+        if size > self.max_memory_bytes:
+            return
+        self._memory[key] = entry
+        self._memory_bytes += size
+        while self._memory_bytes > self.max_memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= self._entry_size(evicted)
+
+    def _read_disk(self, key: str) -> Optional[Tuple[str, str, str]]:
+        if not self.cache_dir:
+            return None
+        path = self._disk_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            # Touch so that disk pruning evicts the least recently used files
+            os.utime(path)
+            return data["raw"], data["cleaned"], data["ext"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _write_disk(self, key: str, entry: Tuple[str, str, str]):
+        if not self.cache_dir:
+            return
+        raw, cleaned, ext = entry
+        path = self._disk_path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            with open(fd, "w", encoding="utf-8") as f:
+                json.dump({"raw": raw, "cleaned": cleaned, "ext": ext}, f)
+            os.replace(tmp_path, path)
+            written = os.path.getsize(path)
+        except OSError as e:
+            print("Error writing parse cache:", e)
+            return
+        with self._lock:
+            if self._disk_bytes is not None:
+                self._disk_bytes += written
+            rescan = self._disk_bytes is None or self._disk_bytes > self.max_disk_bytes
+        if rescan:
+            self._prune_disk()
+
+    def _prune_disk(self):
+        files = []
+        total = 0
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(".json"):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    # Removed by another process since the scan listed it
+                    continue
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+        files.sort()
+        for _, size, path in files:
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+        with self._lock:
+            self._disk_bytes = total
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            self._disk_bytes = None
+        if self.cache_dir:
+            for entry in os.scandir(self.cache_dir):
+                if entry.name.endswith(".json"):
+                    try:
+                        os.remove(entry.path)
+                    except FileNotFoundError:
+                        pass
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+            }
+
+
+_default_cache = None
+
+
+def get_default_cache() -> ParseCache:
+    """Process-wide cache shared by every DocumentParser from get_parser(), on disk only if CACHE_DIR_ENV is set"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ParseCache(os.environ.get(CACHE_DIR_ENV) or None)
+    return _default_cache
@@ -1,45 +1,171 @@
-import os
-import tempfile
-from pathlib import Path
-from typing import Tuple, Optional
+from typing import Tuple, Optional, Iterator
 from file_readers_txt import read_txt
 from file_readers_docx import read_docx
-from file_readers_pdf import read_pdf
+from file_readers_pdf import read_pdf, read_pdf_budgeted, is_image_only_pdf
 from txt_cleaner import normalize_text
 from remove_personal import remove_personal
+from pipeline import iter_clean
+from section_normalizer import has_section_header
+from parse_cache import ParseCache, get_default_cache
+from preflight import preflight, PreflightError
+from supervised_worker import get_shared_pool, OK
+
+# Part of every parse cache key: bump whenever a reader or cleaner changes
+# its output so stale cached text is not served
+PARSER_VERSION = "9"
+
+# Limits applied by get_parser(): a single upload may not hold a Streamlit
+# request for longer than this or grow a worker by more than this much memory
+PARSE_TIMEOUT = 60
+PARSE_MAX_MEMORY_MB = 1024
+PARSE_WORKERS = 2
+
+# Uploads above this size are rejected by preflight before any parsing
+UPLOAD_MAX_MB = 50
+
+# Extraction budget applied by get_parser(): longer PDFs are reduced to their
+# first pages plus the pages holding a known section header, and their raw
+# text is cut at EXTRACT_MAX_CHARS before cleaning and skill matching. TXT
+# and DOCX text is already bounded by the upload size and is kept whole
+EXTRACT_MAX_PAGES = 10
+EXTRACT_MAX_CHARS = 50000
+
+# PDF backend per document from pdf_backend_policy.json (see bench_pdf_backends.py)
+PDF_MODE = "auto"
+
+class DocumentLimitError(RuntimeError):
+    """Raised when a document hits the parse timeout or memory ceiling"""
+
+    def __init__(self, status: str, message: str):
+        super().__init__(f"{status}: {message}")
+        self.status = status
+
+class NeedsOCRError(RuntimeError):
+    """Raised for a scanned PDF: no page has a text layer, so the text needs OCR"""
+
+    def __init__(self):
+        super().__init__("PDF has no text layer (scanned?), needs OCR")
+
+def _read_raw(source, ext: str, pdf_workers: Optional[int] = None,
+              max_pages: Optional[int] = None, max_chars: Optional[int] = None) -> str:
+    # max_pages and max_chars budget PDF extraction only
+    if ext == '.txt':
+        return read_txt(source)
+    if ext == '.docx':
+        return read_docx(source)
+    if ext == '.pdf':
+        try:
+            scanned = is_image_only_pdf(source)
+        except Exception:
+            scanned = False  # unreadable, read_pdf reports it and returns ""
+        if scanned:
+            raise NeedsOCRError()
+        if max_pages:
+            return read_pdf_budgeted(source, max_pages, max_chars, is_key_page=has_section_header,
+                                     mode=PDF_MODE, skip_image_only=False)
+        text = read_pdf(source, workers=pdf_workers, mode=PDF_MODE, skip_image_only=False)
+        return text[:max_chars] if max_chars else text
+    raise ValueError(f"Unsupported file type: {ext}")
+
+def _read_raw_in_worker(*args) -> Optional[str]:
+    # Exceptions come back from a worker as text only, None marks a scanned PDF
+    try:
+        return _read_raw(*args)
+    except NeedsOCRError:
+        return None
 
 class DocumentParser:
     """Unified document parser"""
     
-    def __init__(self):
-        self.temp_dir = tempfile.gettempdir()
-    
-    def save_uploaded_file(self, uploaded_file) -> str:
-        """Save uploaded file to temp directory"""
-        file_path = os.path.join(self.temp_dir, uploaded_file.name)
-        with open(file_path, 'wb') as f:
-            f.write(uploaded_file.getbuffer())
-        return file_path
+    def __init__(self, cache: Optional[ParseCache] = None, timeout: Optional[float] = None,
+                 max_memory_mb: Optional[int] = None, workers: int = PARSE_WORKERS,
+                 max_pages: Optional[int] = None, max_chars: Optional[int] = None,
+                 max_file_mb: Optional[float] = None):
+        # Files are checked by preflight (type, integrity, size) before parsing
+        self.max_file_bytes = int(max_file_mb * 1024 * 1024) if max_file_mb else None
+        self.cache = cache
+        # With a timeout or memory ceiling, raw extraction runs in a
+        # supervised worker process that is killed if it overruns
+        self.timeout = timeout
+        self.max_memory_mb = max_memory_mb
+        self.workers = workers
+        # Optional PDF extraction budget, see read_pdf_budgeted
+        self.max_pages = max_pages
+        self.max_chars = max_chars
     
     def extract_text_auto(self, file_path: str) -> Tuple[str, str, str]:
-        """Extract and clean text from file"""
-        ext = os.path.splitext(file_path)[1].lower()
-        
+        """Extract and clean text from file, raises PreflightError for files that fail the pre-flight checks
+        and NeedsOCRError for scanned PDFs"""
+        ext = preflight(file_path, max_bytes=self.max_file_bytes)
+        if self.cache is None:
+            return self._extract(file_path, ext)
+        # The bytes are needed for the cache key anyway, so parse from memory
+        with open(file_path, 'rb') as f:
+            return self._extract_cached(f.read(), ext)
+
+    def extract_text_bytes(self, data, file_name: str) -> Tuple[str, str, str]:
+        """Extract and clean text from in-memory file content (bytes, memoryview or file-like), raises like extract_text_auto"""
+        ext = preflight(data, file_name, self.max_file_bytes)
+        if self.cache is None:
+            return self._extract(data, ext)
+        if hasattr(data, 'read'):
+            data = data.read()
+        return self._extract_cached(data, ext)
+
+    def extract_uploaded_file(self, uploaded_file) -> Tuple[str, str, str]:
+        """Extract and clean text from a Streamlit upload without writing it to disk"""
+        return self.extract_text_bytes(uploaded_file.getbuffer(), uploaded_file.name)
+
+    def _extract_cached(self, data, ext: str) -> Tuple[str, str, str]:
+        key = self.cache.make_key(data, f"{PARSER_VERSION}:{ext}:{self.max_pages}:{self.max_chars}")
+        result = self.cache.get(key)
+        if result is None:
+            result = self._extract(data, ext)
+            # Readers return "" on failure, don't pin that in the cache
+            if result[0]:
+                self.cache.put(key, result)
+        return result
+
+    def _read_limited(self, source, ext: str) -> str:
+        if ext not in ('.txt', '.docx', '.pdf'):
+            raise ValueError(f"Unsupported file type: {ext}")
+        # Memoryviews and uploads can't be pickled to the worker
+        if isinstance(source, memoryview):
+            source = source.tobytes()
+        elif hasattr(source, 'read'):
+            source = source.read()
+        pool = get_shared_pool(self.workers, self.timeout, self.max_memory_mb)
+        # Supervised workers are daemonic and can't start a PDF page pool
+        status, value = pool.run(_read_raw_in_worker, source, ext, 1, self.max_pages, self.max_chars)
+        if status != OK:
+            raise DocumentLimitError(status, value)
+        if value is None:
+            raise NeedsOCRError()
+        return value
+
+    def _extract(self, source, ext: str) -> Tuple[str, str, str]:
         # Extract raw text
-        if ext == '.txt':
-            raw_text = read_txt(file_path)
-        elif ext == '.docx':
-            raw_text = read_docx(file_path)
-        elif ext == '.pdf':
-            raw_text = read_pdf(file_path)
+        if self.timeout or self.max_memory_mb:
+            raw_text = self._read_limited(source, ext)
         else:
-            raise ValueError(f"Unsupported file type: {ext}")
+            raw_text = _read_raw(source, ext, None, self.max_pages, self.max_chars)
         
         # Clean text
         cleaned_text = remove_personal(raw_text)
         cleaned_text = normalize_text(cleaned_text)
         
         return raw_text, cleaned_text, ext
+
+    def iter_text_auto(self, file_path: str) -> Iterator[str]:
+        """
+        Yield cleaned text page by page (PDF), paragraph by paragraph (DOCX) or
+        chunk by chunk (TXT). Redaction and normalization run on the joined
+        stream, so personal data split across two chunks is still removed and,
+        without an extraction budget (max_pages/max_chars), the pieces join to
+        the text extract_text_auto would return.
+        """
+        preflight(file_path, max_bytes=self.max_file_bytes)
+        return iter_clean(file_path, pdf_mode=PDF_MODE)
     
     def process_text_input(self, text: str, doc_type: str) -> Tuple[str, str, str]:
         """Process manually entered text"""
@@ -50,5 +176,7 @@ class DocumentParser:
         return raw_text, cleaned_text, "text"
 
 def get_parser():
-    """Get parser instance"""
-    return DocumentParser()
\ No newline at end of file
+    """Get parser instance backed by the shared parse cache, parse limits and extraction budget"""
+    return DocumentParser(cache=get_default_cache(), timeout=PARSE_TIMEOUT,
+                          max_memory_mb=PARSE_MAX_MEMORY_MB, max_pages=EXTRACT_MAX_PAGES,
+                          max_chars=EXTRACT_MAX_CHARS, max_file_mb=UPLOAD_MAX_MB)
\ No newline at end of file
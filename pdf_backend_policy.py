@@ -0,0 +1,86 @@
+"""
+Pick a PDF extraction backend per document from cheap characteristics.
+
+The producer/creator metadata puts a document into a class (LaTeX, Word
+export, design tool, ...), and text objects per character on the first
+pages flag "fragmented" documents that place glyphs one by one. The
+class and the page count are then looked up in pdf_backend_policy.json,
+which bench_pdf_backends.py regenerates from measured per-backend time
+and text quality.
+"""
+import json
+import os
+from typing import Dict, Optional
+
+POLICY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pdf_backend_policy.json")
+
+# Used when the policy file is missing or unreadable: always the reference backend
+DEFAULT_POLICY = {
+    "producers": {},
+    "fragmented_chars_per_object": 0,
+    "long_document_pages": 0,
+    "modes": {},
+    "long_modes": {},
+    "default_mode": "layout",
+}
+
+# Pages inspected for character and object counts
+PROBE_PAGES = 2
+
+_policy_cache: Dict[str, Dict] = {}
+
+
+def load_policy(path: str = POLICY_FILE) -> Dict:
+    if path not in _policy_cache:
+        policy = dict(DEFAULT_POLICY)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                policy.update(json.load(f))
+        except FileNotFoundError:
+            pass
+        except ValueError as e:
+            print(f"Ignoring unreadable pdf backend policy {path}: {e}")
+        _policy_cache[path] = policy
+    return _policy_cache[path]
+
+
+def document_features(pdf, probe_pages: int = PROBE_PAGES) -> Dict:
+    """Producer string, page count and text-object density of an open pypdfium2 document"""
+    import pypdfium2 as pdfium
+
+    metadata = pdf.get_metadata_dict()
+    n_chars = n_text_objects = 0
+    for i in range(min(probe_pages, len(pdf))):
+        page = pdf[i]
+        textpage = page.get_textpage()
+        n_chars += textpage.count_chars()
+        textpage.close()
+        n_text_objects += sum(1 for _ in page.get_objects(filter=(pdfium.raw.FPDF_PAGEOBJ_TEXT,)))
+        page.close()
+    return {
+        "producer": f"{metadata.get('Producer', '')} {metadata.get('Creator', '')}".strip(),
+        "pages": len(pdf),
+        "chars_per_object": n_chars / n_text_objects if n_text_objects else 0.0,
+    }
+
+
+def document_class(features: Dict, policy: Optional[Dict] = None) -> str:
+    policy = policy or load_policy()
+    threshold = policy["fragmented_chars_per_object"]
+    if threshold and 0 < features["chars_per_object"] < threshold:
+        return "fragmented"
+    producer = features["producer"].lower()
+    for name, keywords in policy["producers"].items():
+        if any(keyword in producer for keyword in keywords):
+            return name
+    return "other"
+
+
+def choose_mode(features: Dict, policy: Optional[Dict] = None) -> str:
+    """read_pdf mode for a document with these features"""
+    policy = policy or load_policy()
+    doc_class = document_class(features, policy)
+    long_pages = policy["long_document_pages"]
+    if long_pages and features["pages"] >= long_pages and doc_class in policy["long_modes"]:
+        return policy["long_modes"][doc_class]
+    return policy["modes"].get(doc_class, policy["default_mode"])
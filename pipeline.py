@@ -1,22 +1,75 @@
 
 import sys, os
-from file_readers_txt import read_txt
-from file_readers_docx import read_docx
-from file_readers_pdf import read_pdf
-from txt_cleaner import normalize_text
-from remove_personal import remove_personal
-
-def read_any(file_path):
-    ext = os.path.splitext(file_path)[1].lower()
+from file_readers_txt import read_txt, iter_txt_chunks
+from file_readers_docx import read_docx, iter_docx_paragraphs
+from file_readers_pdf import read_pdf, iter_pdf_pages, is_image_only_pdf
+from txt_cleaner import normalize_text, iter_normalize_text, normalize_text_with_offsets
+from remove_personal import remove_personal, iter_remove_personal, remove_personal_with_offsets
+from preflight import preflight, PreflightError, SUPPORTED_EXTENSIONS
+
+def read_any(file_path, file_name=None, pdf_workers=None, pdf_mode="layout", pdf_skip_image_only=True,
+             preflighted=False):
+    # file_path may also be bytes or a file-like object, in which case
+    # file_name supplies the extension used to pick the reader.
+    # pdf_workers=1 keeps PDFs serial when already running inside a pool.
+    # pdf_mode="auto" lets the backend policy pick the PDF backend.
+    # pdf_skip_image_only=False skips the scanned-PDF check for callers that ran it.
+    # Mislabeled, truncated or empty files raise preflight.PreflightError,
+    # preflighted=True skips the checks for callers that already ran them.
+    ext = os.path.splitext(file_name or file_path)[1].lower()
+    if ext in SUPPORTED_EXTENSIONS and not preflighted:
+        preflight(file_path, file_name)
     if ext == '.txt': 
         return read_txt(file_path)
     if ext == '.docx': 
         return read_docx(file_path)
     if ext == '.pdf': 
-        return read_pdf(file_path)
+        return read_pdf(file_path, workers=pdf_workers, mode=pdf_mode,
+                        skip_image_only=pdf_skip_image_only)
     print("Unsupported file type:", ext)
     return ""
 
+def iter_any(file_path, file_name=None, pdf_mode="layout", pdf_skip_image_only=True):
+    """Streaming counterpart of read_any: yields pages, paragraphs or text chunks.
+    Scanned PDFs yield nothing, as read_pdf returns "" for them."""
+    ext = os.path.splitext(file_name or file_path)[1].lower()
+    if ext == '.txt':
+        return iter_txt_chunks(file_path)
+    if ext == '.docx':
+        return iter_docx_paragraphs(file_path)
+    if ext == '.pdf':
+        if pdf_skip_image_only and is_image_only_pdf(file_path):
+            print("PDF has no text layer (scanned?), needs OCR")
+            return iter(())
+        return iter_pdf_pages(file_path, pdf_mode)
+    print("Unsupported file type:", ext)
+    return iter(())
+
+def _with_separators(pieces, separator):
+    first = True
+    for piece in pieces:
+        if not first:
+            yield separator
+        first = False
+        yield piece
+
+def iter_clean(file_path, file_name=None, pdf_mode="layout"):
+    """Cleaned text of a file as a stream of pieces, joining to normalize_text(remove_personal(read_any(...))).
+    Memory stays bounded by a reader chunk plus the carried-over text, not the file size."""
+    ext = os.path.splitext(file_name or file_path)[1].lower()
+    chunks = iter_any(file_path, file_name, pdf_mode)
+    if ext in ('.pdf', '.docx'):
+        # read_any joins pages and paragraphs with newlines
+        chunks = _with_separators(chunks, "\n")
+    return iter_normalize_text(iter_remove_personal(chunks))
+
+def clean_with_offsets(raw):
+    """normalize_text(remove_personal(raw)) plus the OffsetMap from the cleaned text back to raw,
+    so spans found in the cleaned text can be located in the original document."""
+    redacted, redaction_offsets = remove_personal_with_offsets(raw)
+    cleaned, cleaning_offsets = normalize_text_with_offsets(redacted)
+    return cleaned, redaction_offsets.compose(cleaning_offsets)
+
 if __name__ == "__main__":
     # Default file = Bulli_raju_Resume.pdf if no argument is passed
     file_path = "Bulli_raju_Resume.pdf"
@@ -25,7 +78,11 @@ if __name__ == "__main__":
 
     print(f"Processing file: {file_path}")
 
-    raw = read_any(file_path)
+    try:
+        raw = read_any(file_path)
+    except PreflightError as e:
+        print("Rejected:", e)
+        sys.exit(1)
     if not raw.strip():
         print("No text extracted.")
         sys.exit(1)
@@ -0,0 +1,135 @@
+"""
+Cheap checks run before a document reaches a parser.
+
+Only the first and last few KB of a file are read: the extension has to
+match the magic bytes, a PDF has to end with its %%EOF marker, a DOCX has
+to be a complete ZIP whose central directory lists word/document.xml, and
+a text file must not contain NUL bytes (unless it is UTF-16/32). A
+rejected file raises PreflightError with a machine-readable `reason`
+instead of failing inside pdfplumber / python-docx.
+"""
+import os
+import struct
+from typing import Optional
+
+from file_readers_txt import SNIFF_SIZE, sniff_encoding
+
+# PreflightError.reason values
+EMPTY, TOO_LARGE, UNSUPPORTED, TYPE_MISMATCH, TRUNCATED, BINARY = (
+    "empty", "too_large", "unsupported", "type_mismatch", "truncated", "binary")
+
+SUPPORTED_EXTENSIONS = ('.txt', '.docx', '.pdf')
+
+# A .pdf header may be preceded by junk, readers accept it within 1KB. Only
+# a header at offset 0 makes a file of another type count as a PDF
+PDF_HEADER_WINDOW = 1024
+PDF_TRAILER_WINDOW = 1024
+
+# End of central directory record: fixed 22 bytes plus a comment of up to 64KB
+_EOCD_SIGNATURE = b"PK\x05\x06"
+_EOCD_STRUCT = struct.Struct("<4s4H2LH")
+_ZIP_TAIL_WINDOW = _EOCD_STRUCT.size + 0xFFFF
+
+
+class PreflightError(ValueError):
+    """Raised when a file is rejected before parsing"""
+
+    def __init__(self, reason: str, message: str):
+        super().__init__(f"{reason}: {message}")
+        self.reason = reason
+
+
+def _size(source) -> int:
+    if isinstance(source, (str, os.PathLike)):
+        return os.path.getsize(source)
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return len(source)
+    position = source.tell()
+    size = source.seek(0, os.SEEK_END)
+    source.seek(position)
+    return size
+
+
+def _read_at(source, offset: int, length: int) -> bytes:
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return bytes(source[offset:offset + length])
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            f.seek(offset)
+            return f.read(length)
+    position = source.tell()
+    try:
+        source.seek(offset)
+        return source.read(length)
+    finally:
+        source.seek(position)
+
+
+def detect_type(head: bytes) -> Optional[str]:
+    """Extension implied by the magic bytes, or None for anything else (e.g. text)"""
+    if head.startswith(b"%PDF-"):
+        return ".pdf"
+    if head.startswith(b"PK\x03\x04") or head.startswith(_EOCD_SIGNATURE):
+        return ".docx"
+    return None
+
+
+def _check_pdf(source, size: int):
+    tail = _read_at(source, max(0, size - PDF_TRAILER_WINDOW), PDF_TRAILER_WINDOW)
+    if b"%%EOF" not in tail:
+        raise PreflightError(TRUNCATED, "PDF has no %%EOF trailer")
+
+
+def _check_docx(source, size: int):
+    tail_start = max(0, size - _ZIP_TAIL_WINDOW)
+    tail = _read_at(source, tail_start, _ZIP_TAIL_WINDOW)
+    eocd = tail.rfind(_EOCD_SIGNATURE)
+    if eocd < 0 or len(tail) - eocd < _EOCD_STRUCT.size:
+        raise PreflightError(TRUNCATED, "ZIP end of central directory not found")
+    _, _, _, _, _, cd_size, cd_offset, _ = _EOCD_STRUCT.unpack_from(tail, eocd)
+    if cd_offset == 0xFFFFFFFF or cd_size == 0xFFFFFFFF:
+        return  # ZIP64, leave it to zipfile
+    if cd_offset + cd_size > tail_start + eocd:
+        raise PreflightError(TRUNCATED, "ZIP central directory is cut off")
+    if b"word/document.xml" not in _read_at(source, cd_offset, cd_size):
+        raise PreflightError(TYPE_MISMATCH, "ZIP archive without word/document.xml is not a DOCX")
+
+
+def _check_txt(head: bytes):
+    encoding, _ = sniff_encoding(head)
+    if encoding == 'utf-8' and b"\0" in head:
+        raise PreflightError(BINARY, "text file contains NUL bytes")
+
+
+def preflight(source, file_name: Optional[str] = None, max_bytes: Optional[int] = None) -> str:
+    """
+    Validate a path, bytes, memoryview or seekable file-like object and
+    return its lowercased extension. `file_name` supplies the extension for
+    in-memory sources. Raises PreflightError on rejection.
+    """
+    ext = os.path.splitext(file_name or source)[1].lower()
+    if ext not in SUPPORTED_EXTENSIONS:
+        raise PreflightError(UNSUPPORTED, f"unsupported file type {ext or '(none)'}")
+    try:
+        size = _size(source)
+        if not size:
+            raise PreflightError(EMPTY, "file is empty")
+        if max_bytes and size > max_bytes:
+            raise PreflightError(TOO_LARGE, f"{size} bytes exceeds the {max_bytes} byte limit")
+        head = _read_at(source, 0, SNIFF_SIZE)
+        detected = detect_type(head)
+        if ext == '.pdf' and detected is None and b"%PDF-" in head[:PDF_HEADER_WINDOW]:
+            detected = '.pdf'
+        if ext == '.txt':
+            if detected is not None:
+                raise PreflightError(TYPE_MISMATCH, f"{ext} file has {detected} content")
+            _check_txt(head)
+        elif detected != ext:
+            raise PreflightError(TYPE_MISMATCH, f"{ext} file has {detected or 'text'} content")
+        elif ext == '.pdf':
+            _check_pdf(source, size)
+        else:
+            _check_docx(source, size)
+    except OSError as e:
+        raise PreflightError(TRUNCATED, f"unreadable: {e}") from e
+    return ext
@@ -0,0 +1,104 @@
+"""
+Rule-based redaction that builds the output in one go.
+
+Rules are compiled once and applied as a priority cascade: the first rule
+scans the whole text, every later rule only scans the gaps left between
+the matches of the rules before it. Each gap is sliced out before it is
+searched, so anchors and \\b see a string boundary where a replacement
+token (which starts and ends with a non-word character) would sit. The
+result is the same as running the rules one after another with re.sub,
+as long as no rule can match across a replacement token, but the text
+is copied once instead of once per rule.
+"""
+import re
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+
+class RedactionRule:
+    """
+    A named pattern and the token its matches are replaced with.
+    `required` optionally lists substrings of which every match contains
+    at least one; gaps without any of them are skipped without a search.
+    """
+
+    def __init__(self, name: str, pattern: str, replacement: str, flags: int = 0,
+                 required: Optional[Sequence[str]] = None):
+        self.name = name
+        self.replacement = replacement
+        self.regex = re.compile(pattern, flags)
+        self.required = tuple(required) if required else None
+
+    def spans(self, text: str) -> Iterator[Tuple[int, int]]:
+        """(start, end) of each match in text, left to right and non-overlapping"""
+        if self.required is not None and not any(literal in text for literal in self.required):
+            return
+        for match in self.regex.finditer(text):
+            yield match.span()
+
+    def __repr__(self):
+        return f"RedactionRule({self.name!r}, {self.regex.pattern!r}, {self.replacement!r})"
+
+
+class ScannerRule(RedactionRule):
+    """
+    A rule whose spans come from `scan(text)`, a hand-written scanner
+    yielding (start, end) pairs, instead of a regex. Used where a pattern
+    can backtrack superlinearly on adversarial input.
+    """
+
+    def __init__(self, name: str, scan: Callable[[str], Iterable[Tuple[int, int]]], replacement: str,
+                 required: Optional[Sequence[str]] = None):
+        self.name = name
+        self.replacement = replacement
+        self.scan = scan
+        self.regex = None
+        self.required = tuple(required) if required else None
+
+    def spans(self, text: str) -> Iterator[Tuple[int, int]]:
+        if self.required is not None and not any(literal in text for literal in self.required):
+            return iter(())
+        return iter(self.scan(text))
+
+    def __repr__(self):
+        return f"ScannerRule({self.name!r}, {self.scan.__name__}, {self.replacement!r})"
+
+
+class Redactor:
+    """Applies `rules` in priority order, see the module docstring"""
+
+    def __init__(self, rules: Iterable[RedactionRule]):
+        self.rules = list(rules)
+
+    def spans(self, text: str) -> List[Tuple[int, int, RedactionRule]]:
+        """Sorted (start, end, rule) of every span the rules redact"""
+        found = []
+        gaps = [(0, len(text))]
+        for rule in self.rules:
+            remaining = []
+            for gap_start, gap_end in gaps:
+                pos = gap_start
+                for start, end in rule.spans(text[gap_start:gap_end]):
+                    found.append((gap_start + start, gap_start + end, rule))
+                    if pos < gap_start + start:
+                        remaining.append((pos, gap_start + start))
+                    pos = gap_start + end
+                if pos < gap_end:
+                    remaining.append((pos, gap_end))
+            gaps = remaining
+            if not gaps:
+                break
+        found.sort(key=lambda span: span[0])
+        return found
+
+    def redact(self, text: str) -> str:
+        spans = self.spans(text)
+        if not spans:
+            return text
+        parts = []
+        pos = 0
+        for start, end, rule in spans:
+            parts.append(text[pos:start])
+            parts.append(rule.replacement)
+            pos = end
+        parts.append(text[pos:])
+        return "".join(parts)
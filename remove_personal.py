@@ -1,15 +1,134 @@
 import re
+from offset_map import apply_edits
+from redaction import RedactionRule, Redactor, ScannerRule
+
+EMAIL_PATTERN = r'\S+@\S+\.\S+'
+URL_PATTERN = r'http\S+|www\.\S+'
+# Phone numbers (basic pattern)
+PHONE_PATTERN = r'\+?\d[\d\-\s]{7,}\d'
+# Dates with formats like mm/yyyy, mm/yyyy-mm/yyyy, yyyy-mm-dd, Month dd, yyyy, etc.
+DATE_PATTERN = r'(\b\d{1,2}[/\-]\d{2,4}\b|\b\d{4}[/\-]\d{1,2}[/\-]\d{1,2}\b|\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},?\s+\d{4}\b)'
+
+# Scanners with the same matches as EMAIL_PATTERN / PHONE_PATTERN in
+# guaranteed linear time. Every regex below is tried once per token or
+# per digit run, never at every position inside one.
+_EMAIL_TOKEN = re.compile(r'(?<!\S)[^\s@]*@\S*')
+_PHONE_RUN = re.compile(r'[\d\-\s]{9,}')
+_DIGIT = re.compile(r'\d')
+_PHONE_FROM_DIGIT = re.compile(r'\d[\d\-\s]{7,}\d')
+
+def scan_emails(text):
+    """Spans of EMAIL_PATTERN matches. A match always covers a whole
+    whitespace-delimited token: one with an '@' after its first character
+    and a '.' at least two characters after that '@' but before the last character."""
+    for token in _EMAIL_TOKEN.finditer(text):
+        start, end = token.span()
+        at = text.find('@', start + 1, end)
+        if at >= 0 and text.rfind('.', at + 2, end - 1) >= 0:
+            yield start, end
+
+def scan_phones(text):
+    """Spans of PHONE_PATTERN matches. Within a maximal run of digits,
+    dashes and whitespace only the first digit can start a match, which
+    then ends at the run's last digit if that is at least 8 characters on."""
+    for run in _PHONE_RUN.finditer(text):
+        start, end = run.span()
+        first = _DIGIT.search(text, start, end)
+        if first is None or end - first.start() < 9:
+            continue
+        match = _PHONE_FROM_DIGIT.match(text, first.start(), end)
+        if match is None:
+            continue
+        begin = first.start()
+        if begin > 0 and text[begin - 1] == '+':
+            begin -= 1
+        yield begin, match.end()
+
+# Applied in this order: an email is never also matched as a URL or phone.
+# URL_PATTERN never backtracks (its \S+ runs to the end of the token) and
+# every date alternative has bounded repeats; the added lookahead only lets
+# the engine skip positions where no date can start.
+PERSONAL_RULES = [
+    ScannerRule('email', scan_emails, '[EMAIL]', required=['@']),
+    RedactionRule('url', URL_PATTERN, '[URL]', required=['http', 'www.']),
+    ScannerRule('phone', scan_phones, '[PHONE]'),
+    RedactionRule('date', r'(?=[\dJFMASOND])' + DATE_PATTERN, '[DATE]', re.IGNORECASE),
+]
+
+_redactor = Redactor(PERSONAL_RULES)
 
 def remove_personal(text):
+    """Replace emails, URLs, phone numbers and dates with placeholder tokens."""
+    return _redactor.redact(text)
+
+def remove_personal_with_offsets(text):
+    """remove_personal plus the OffsetMap from the redacted text back to `text`."""
+    return apply_edits(text, [(start, end, rule.replacement) for start, end, rule in _redactor.spans(text)])
+
+def remove_personal_sequential(text):
+    """The original one re.sub pass per rule, kept as the reference for tests and benchmarks."""
     # Remove emails
-    text = re.sub(r'\S+@\S+\.\S+', '[EMAIL]', text)
+    text = re.sub(EMAIL_PATTERN, '[EMAIL]', text)
     # Remove URLs
-    text = re.sub(r'http\S+|www\.\S+', '[URL]', text)
+    text = re.sub(URL_PATTERN, '[URL]', text)
     # Remove phone numbers (basic pattern)
-    text = re.sub(r'\+?\d[\d\-\s]{7,}\d', '[PHONE]', text)
-    
+    text = re.sub(PHONE_PATTERN, '[PHONE]', text)
+
     # Remove dates with formats like mm/yyyy, mm/yyyy-mm/yyyy, yyyy-mm-dd, Month dd, yyyy, etc.
-    date_pattern = r'(\b\d{1,2}[/\-]\d{2,4}\b|\b\d{4}[/\-]\d{1,2}[/\-]\d{1,2}\b|\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},?\s+\d{4}\b)'
-    text = re.sub(date_pattern, '[DATE]', text, flags=re.IGNORECASE)
+    text = re.sub(DATE_PATTERN, '[DATE]', text, flags=re.IGNORECASE)
 
     return text
+
+# A chunk is only cut after whitespace followed by a character no rule can
+# continue through (not whitespace, a digit or a dash): email and URL matches
+# never contain whitespace, and phone and date matches only continue after
+# whitespace with a digit, dash or more whitespace.
+_SAFE_CUT = re.compile(r'\s[^\s\d\-]')
+# Where the last safe cut is looked for, and how much text may be held back
+# before it is cut anyway
+SAFE_CUT_WINDOW = 4096
+STREAM_MAX_CARRY = 1024 * 1024
+
+def _last_safe_cut(text, start):
+    cut = -1
+    for match in _SAFE_CUT.finditer(text, start):
+        cut = match.start() + 1
+    return cut
+
+def iter_remove_personal(chunks):
+    """Streaming remove_personal: yields redacted pieces of the concatenated chunks.
+    Matches that cross a chunk boundary are carried over, so the joined
+    output equals remove_personal(''.join(chunks)) unless more than
+    STREAM_MAX_CARRY characters pass without a safe cut point."""
+    # Chunks held back since the last cut, joined only when they are cut, so
+    # a long stretch without a safe cut point is not copied once per chunk
+    held, held_len = [], 0
+    last_char = ''
+    for chunk in chunks:
+        if not chunk:
+            continue
+        start = max(0, len(chunk) - SAFE_CUT_WINDOW)
+        # One character before the window, a cut may fall on the chunk boundary
+        before = chunk[start - 1] if start else last_char
+        cut = _last_safe_cut(before + chunk[start:], 0)
+        last_char = chunk[-1]
+        if cut >= 0:
+            cut += start - len(before)
+            held.append(chunk[:cut])
+            text = ''.join(held)
+            held, held_len = [chunk[cut:]], len(chunk) - cut
+            if text:
+                yield _redactor.redact(text)
+            continue
+        held.append(chunk)
+        held_len += len(chunk)
+        if held_len > STREAM_MAX_CARRY:
+            text = ''.join(held)
+            cut = _last_safe_cut(text, 0)
+            if cut < 0:
+                cut = len(text)
+            held, held_len = [text[cut:]], len(text) - cut
+            yield _redactor.redact(text[:cut])
+    text = ''.join(held)
+    if text:
+        yield _redactor.redact(text)
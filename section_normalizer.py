@@ -1,28 +1,116 @@
+import json
+import os
 import re
-from src.txt_cleaner import normalize_text as basic_normalize
+try:
+    from src.txt_cleaner import normalize_text as basic_normalize
+except ImportError:
+    # Running from the project root rather than through the src package
+    from txt_cleaner import normalize_text as basic_normalize
 
-def standardize_sections(text):
+# Canonical section name -> header spellings. Extend section_headers.json to
+# recognise more headers; these are used if the file is missing.
+SECTION_HEADERS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'section_headers.json')
+DEFAULT_SECTION_HEADERS = {
+    'EDUCATION': ['EDUCATION'],
+    'SKILLS': ['SKILLS', 'CORE COMPETENCIES', 'AREAS OF EXPERTISE'],
+    'PROJECTS': ['PROJECTS', 'RELEVANT PROJECTS', 'PORTFOLIO'],
+    'EXPERIENCE': ['EXPERIENCE', 'WORK HISTORY', 'PROFESSIONAL EXPERIENCE', 'INTERNSHIP'],
+}
+
+# Whitespace that doesn't end the line, so a match never spans lines
+_HSPACE = r'[^\S\n]'
+
+def load_section_headers(path=SECTION_HEADERS_FILE):
+    """Read the {section: [header, ...]} table, falling back to DEFAULT_SECTION_HEADERS."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return DEFAULT_SECTION_HEADERS
+    except ValueError as e:
+        print(f"Ignoring unreadable section header table {path}: {e}")
+        return DEFAULT_SECTION_HEADERS
+
+def _header_key(header):
+    return ' '.join(header.split()).upper()
+
+def compile_section_headers(headers):
     """
-    with the '=== HEADER ===' format.
+    Compile a header table into one line-anchored pattern plus a lookup from
+    the spelling (upper-cased, single-spaced) to its canonical section name.
+    A header matches alone on its line, optionally followed by ':' or '.'.
     """
-    def replace_if_line_alone(text, section_names, replacement):
-        # The pattern matches only when the section header is on a line by itself,
-        # possibly followed by a colon or dot, and surrounded by whitespace.
-        # It uses the MULTILINE flag (re.MULTILINE or re.M) for ^ and $ to match start/end of a line.
-        pattern = r'^\s*(' + '|'.join(section_names) + r')\s*[:.]?\s*$'
-        return re.sub(pattern, replacement, text, flags=re.IGNORECASE | re.MULTILINE)
+    canonical = {}
+    for section, names in headers.items():
+        for name in names:
+            canonical.setdefault(_header_key(name), section)
+    # Longest first, so the alternation settles on the right spelling quickly
+    spellings = sorted(canonical, key=len, reverse=True)
+    alternatives = '|'.join((_HSPACE + '+').join(re.escape(word) for word in key.split()) for key in spellings)
+    pattern = re.compile(
+        rf'^{_HSPACE}*(?P<header>{alternatives}){_HSPACE}*[:.]?{_HSPACE}*$',
+        re.IGNORECASE | re.MULTILINE)
+    return pattern, canonical
+
+SECTION_HEADERS = load_section_headers()
+_HEADER_LINE, _CANONICAL = compile_section_headers(SECTION_HEADERS)
+_SPACES = re.compile(r'[ ]{2,}')
+
+# Name of the span before the first header (contact details, summary)
+PREAMBLE = 'PREAMBLE'
+
+# A header line, or a marker line already written by standardize_sections
+_SECTION_LINE = re.compile(rf'(?:{_HEADER_LINE.pattern})|(?:^=== (?P<marker>[A-Z][A-Z ]*) ===$)',
+                           re.IGNORECASE | re.MULTILINE)
+_NON_SPACE = re.compile(r'\S')
+
+def has_section_header(text):
+    """True if any known section header sits on a line of its own in text."""
+    return _HEADER_LINE.search(text) is not None
 
-    # Standardize the headers using the line-alone constraint
-    text = replace_if_line_alone(text, ['EDUCATION'], '=== EDUCATION ===')
-    text = replace_if_line_alone(text, ['SKILLS', 'CORE COMPETENCIES', 'AREAS OF EXPERTISE'], '=== SKILLS ===')
-    text = replace_if_line_alone(text, ['PROJECTS', 'RELEVANT PROJECTS', 'PORTFOLIO'], '=== PROJECTS ===')
-    text = replace_if_line_alone(text, ['EXPERIENCE', 'WORK HISTORY', 'PROFESSIONAL EXPERIENCE', 'INTERNSHIP'], '=== EXPERIENCE ===')
+def _rewrite(match):
+    return f"=== {_CANONICAL[_header_key(match.group('header'))]} ==="
+
+def standardize_sections(text):
+    """
+    Replace section headers that sit alone on their line (e.g. "Technical Skills:")
+    with the '=== SECTION ===' format. All headers are rewritten in one scan.
+    """
+    text = _HEADER_LINE.sub(_rewrite, text)
 
     # Final cleanup: Collapse multiple horizontal spaces (preserves newlines)
-    text = re.sub(r'[ ]{2,}', ' ', text)
+    text = _SPACES.sub(' ', text)
     return text.strip()
 
 
+def section_index(text):
+    """
+    Return (section, start, end) spans of the text under each header, in
+    document order. Works on raw header lines as well as on '=== SECTION ==='
+    markers. The span of a section runs from the line after its header to
+    the next header; text before the first header is reported as PREAMBLE
+    unless it is blank. Slice text[start:end] to get a section's body.
+    """
+    spans = []
+    name, start = PREAMBLE, 0
+    for match in _SECTION_LINE.finditer(text):
+        if name != PREAMBLE or _NON_SPACE.search(text, start, match.start()):
+            spans.append((name, start, match.start()))
+        if match.group('marker'):
+            name = match.group('marker').upper()
+        else:
+            name = _CANONICAL[_header_key(match.group('header'))]
+        start = match.end() + 1 if text.startswith('\n', match.end()) else match.end()
+    if name != PREAMBLE or _NON_SPACE.search(text, start):
+        spans.append((name, start, len(text)))
+    return spans
+
+def normalize_text_with_sections(text):
+    """normalize_text plus the section_index of its result."""
+    text = normalize_text(text)
+    return text, section_index(text)
+
+
 def normalize_text(text):
     """
     The main wrapper function for text and section normalization.
@@ -1,3 +1,5 @@
+from bisect import bisect_right
+
 import spacy
 from spacy.matcher import PhraseMatcher
 
@@ -56,6 +58,79 @@ def extract_skills(clean_text, skills_file_path):
     # Return the unique list of skills found
     return sorted(list(found_skills))
 
+# 4. Character spans of the matches, for highlighting and annotation
+def skill_spans(clean_text, skills_file_path, offsets=None):
+    """
+    Returns sorted (start, end, skill) character spans of every match in
+    clean_text. With `offsets`, the OffsetMap from pipeline.clean_with_offsets,
+    the spans are positions in the original document instead.
+    """
+    skill_patterns = load_skills(skills_file_path)
+    if not skill_patterns:
+        return []
+    matcher = PhraseMatcher(nlp.vocab)
+    matcher.add("SKILL", skill_patterns)
+    doc = nlp(clean_text)
+
+    spans = []
+    for match_id, start, end in matcher(doc):
+        span = doc[start:end]
+        start_char, end_char = span.start_char, span.end_char
+        if offsets is not None:
+            start_char, end_char = offsets.span_to_original(start_char, end_char)
+        spans.append((start_char, end_char, span.text))
+    return sorted(spans)
+
+# Default weight of a match by the section it was found in. Sections not
+# listed here are skipped by extract_skills_by_section.
+SECTION_WEIGHTS = {
+    'SKILLS': 1.0,
+    'EXPERIENCE': 0.8,
+    'PROJECTS': 0.7,
+    'PREAMBLE': 0.5,
+    'EDUCATION': 0.3,
+}
+
+# 5. Section-aware extraction
+def extract_skills_by_section(clean_text, skills_file_path, weights=None, sections=None):
+    """
+    Weight each skill by the best selected section it was found in. The text
+    is tokenized once, without the rest of the spaCy pipeline, and each
+    match is assigned to the section span holding it. `sections` is a section_index list of
+    (name, start, end) spans; it is computed when not given. Returns
+    {skill: weight}. Text without any recognised header is matched as a whole
+    with weight 1.0.
+    """
+    from section_normalizer import section_index
+
+    weights = SECTION_WEIGHTS if weights is None else weights
+    if sections is None:
+        sections = section_index(clean_text)
+    if not any(name != 'PREAMBLE' for name, _, _ in sections):
+        return {skill: 1.0 for skill in extract_skills(clean_text, skills_file_path)}
+
+    skill_patterns = load_skills(skills_file_path)
+    if not skill_patterns:
+        return {}
+    matcher = PhraseMatcher(nlp.vocab)
+    matcher.add("SKILL", skill_patterns)
+
+    selected = sorted((start, end, name) for name, start, end in sections if name in weights and end > start)
+    starts = [start for start, _, _ in selected]
+    found = {}
+    # The matcher compares token text (ORTH) only, so the tokenizer is all
+    # the document needs; the tagger and parser never run
+    doc = nlp.make_doc(clean_text)
+    for match_id, start, end in matcher(doc):
+        span = doc[start:end]
+        # Matches in header lines or unselected sections belong to no span
+        i = bisect_right(starts, span.start_char) - 1
+        if i < 0 or span.end_char > selected[i][1]:
+            continue
+        skill = span.text
+        found[skill] = max(found.get(skill, 0.0), weights[selected[i][2]])
+    return found
+
 # --- Example of how to use this function (will be imported by pipeline.py later) ---
 if __name__ == '__main__':
     # Since you run this script from the parent folder (skillgapAI), 
@@ -164,9 +164,16 @@ class SkillAnnotator:
     def __init__(self, skill_db):
         self.skill_db = skill_db
     
-    def auto_annotate(self, text: str) -> List[Tuple]:
-        """Auto-annotate text with skills"""
+    def auto_annotate(self, text: str, spans: Optional[List[Tuple]] = None) -> List[Tuple]:
+        """Auto-annotate text with skills. `spans` are (start, end, skill) matches
+        used instead of searching, as positions in `text` itself: spans from
+        skill_extractor.skill_spans(clean_text, ...) go with the cleaned text,
+        spans from skill_spans(clean_text, ..., offsets) with the original document."""
         annotations = []
+        if spans is not None:
+            for start_idx, end_idx, _ in spans:
+                annotations.append((text, {'entities': [(start_idx, end_idx, 'SKILL')]}))
+            return annotations
         text_lower = text.lower()
         
         for skill in list(self.skill_db.skills)[:50]:  # Limit for performance
@@ -0,0 +1,191 @@
+"""
+Worker processes that run one document at a time under a wall-clock
+timeout and a memory ceiling. A worker that overruns either limit is
+killed and replaced, and the caller gets a status instead of a hang.
+"""
+import multiprocessing
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows: the memory ceiling is not enforced
+    resource = None
+
+# Statuses returned alongside the value by SupervisedWorker.run
+OK, ERROR, TIMEOUT, TOO_LARGE, CRASHED = "ok", "error", "timeout", "too_large", "crashed"
+
+
+def _address_space_bytes() -> Optional[int]:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+
+def _limit_memory(max_memory_bytes: int):
+    # The ceiling is on top of what the (forked) worker already maps, so it
+    # bounds what a single document may allocate rather than the whole app
+    if resource is None:
+        return
+    baseline = _address_space_bytes()
+    if baseline is None:
+        return
+    limit = baseline + max_memory_bytes
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+
+def _worker_main(conn, max_memory_bytes):
+    if max_memory_bytes:
+        _limit_memory(max_memory_bytes)
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            return
+        if job is None:
+            return
+        func, args = job
+        try:
+            conn.send((OK, func(*args)))
+        except MemoryError:
+            # The heap may be in a bad state, let the supervisor start afresh
+            conn.send((TOO_LARGE, "memory limit exceeded"))
+            return
+        except Exception as e:
+            conn.send((ERROR, f"{type(e).__name__}: {e}"))
+
+
+class SupervisedWorker:
+    """A single worker process plus the logic to kill and replace it"""
+
+    def __init__(self, timeout: Optional[float] = None, max_memory_mb: Optional[int] = None):
+        self.timeout = timeout
+        self.max_memory_bytes = max_memory_mb * 1024 * 1024 if max_memory_mb else None
+        self.restarts = 0
+        self._start()
+
+    def _start(self):
+        self._conn, child_conn = multiprocessing.Pipe()
+        self._process = multiprocessing.Process(
+            target=_worker_main, args=(child_conn, self.max_memory_bytes), daemon=True)
+        self._process.start()
+        child_conn.close()
+
+    def _restart(self):
+        self._process.kill()
+        self._process.join()
+        self._conn.close()
+        self.restarts += 1
+        self._start()
+
+    def run(self, func: Callable, args: Tuple = ()) -> Tuple[str, Any]:
+        """Run func(*args) in the worker and return (status, value)"""
+        try:
+            self._conn.send((func, args))
+        except (BrokenPipeError, OSError):
+            self._restart()
+            self._conn.send((func, args))
+        if not self._conn.poll(self.timeout):
+            self._restart()
+            return TIMEOUT, f"exceeded {self.timeout}s"
+        try:
+            status, value = self._conn.recv()
+        except EOFError:
+            self._process.join(1)
+            exitcode = self._process.exitcode
+            self._restart()
+            return CRASHED, f"worker exited with code {exitcode}"
+        if status == TOO_LARGE:
+            self._restart()
+        return status, value
+
+    def close(self):
+        try:
+            self._conn.send(None)
+        except OSError:
+            pass
+        self._process.join(1)
+        if self._process.is_alive():
+            self._process.kill()
+        self._conn.close()
+
+
+class SupervisedPool:
+    """
+    A fixed set of SupervisedWorkers. run() is thread-safe, so one pool can
+    serve several Streamlit sessions or the threads of map_unordered().
+    """
+
+    def __init__(self, workers: Optional[int] = None, timeout: Optional[float] = None,
+                 max_memory_mb: Optional[int] = None):
+        self.workers = workers or os.cpu_count() or 1
+        self._all = [SupervisedWorker(timeout, max_memory_mb) for _ in range(self.workers)]
+        self._idle = queue.Queue()
+        for worker in self._all:
+            self._idle.put(worker)
+
+    @property
+    def restarts(self) -> int:
+        return sum(w.restarts for w in self._all)
+
+    def run(self, func: Callable, *args) -> Tuple[str, Any]:
+        worker = self._idle.get()
+        try:
+            return worker.run(func, args)
+        finally:
+            self._idle.put(worker)
+
+    def map_unordered(self, func: Callable, items: Iterable,
+                      max_in_flight: Optional[int] = None) -> Iterator[Tuple[Any, str, Any]]:
+        """Yield (item, status, value) for func(item) in completion order"""
+        max_in_flight = max_in_flight or self.workers * 4
+        items = iter(items)
+        with ThreadPoolExecutor(max_workers=self.workers) as threads:
+            in_flight = {}
+            while True:
+                for item in items:
+                    in_flight[threads.submit(self.run, func, item)] = item
+                    if len(in_flight) >= max_in_flight:
+                        break
+                if not in_flight:
+                    break
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item = in_flight.pop(future)
+                    try:
+                        status, value = future.result()
+                    except Exception as e:
+                        # e.g. the job could not be pickled to the worker
+                        status, value = ERROR, f"{type(e).__name__}: {e}"
+                    yield item, status, value
+
+    def close(self):
+        for worker in self._all:
+            worker.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+_shared_pools = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_pool(workers: int, timeout: Optional[float], max_memory_mb: Optional[int]) -> SupervisedPool:
+    """One long-lived pool per configuration, shared across DocumentParser instances"""
+    key = (workers, timeout, max_memory_mb)
+    with _shared_lock:
+        if key not in _shared_pools:
+            _shared_pools[key] = SupervisedPool(workers, timeout, max_memory_mb)
+        return _shared_pools[key]
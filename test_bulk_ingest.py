@@ -0,0 +1,103 @@
+import io
+import os
+import tarfile
+import zipfile
+
+from bulk_ingest import BulkIngestor, IngestResult, cleaned_name, iter_archive_members, write_cleaned
+
+RESUME = b"Skills\nPython SQL\n"
+LONG = b"Skills\n" + b"Python SQL Docker\n" * 40
+BIG = b"Skills\n" + b"Python SQL Docker\n" * 200
+
+
+def _patch_zip_member(data, name, local_field, central_field, value):
+    # Overwrite a 2-byte field of one member in both its local header and
+    # its central directory entry
+    for info in zipfile.ZipFile(io.BytesIO(bytes(data))).infolist():
+        if info.filename == name:
+            data[info.header_offset + local_field:info.header_offset + local_field + 2] = value.to_bytes(2, "little")
+    pos = data.find(b"PK\x01\x02")
+    while pos >= 0:
+        name_len = int.from_bytes(data[pos + 28:pos + 30], "little")
+        if data[pos + 46:pos + 46 + name_len] == name.encode():
+            data[pos + central_field:pos + central_field + 2] = value.to_bytes(2, "little")
+        pos = data.find(b"PK\x01\x02", pos + 4)
+
+
+def _write_zip(path):
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("a.txt", RESUME)
+        zf.writestr("corrupt.txt", LONG)
+        zf.writestr("deflate64.txt", RESUME)
+        zf.writestr("encrypted.txt", RESUME)
+        zf.writestr("big.txt", BIG)
+        zf.writestr("notes.md", RESUME)
+        zf.writestr("z.txt", RESUME)
+    data = bytearray(buf.getvalue())
+    info = zipfile.ZipFile(io.BytesIO(bytes(data))).getinfo("corrupt.txt")
+    start = info.header_offset + 30 + len(info.filename) + len(info.extra)
+    data[start:start + 8] = b"\xff" * 8
+    # Compression method 9 is Deflate64, flag bit 0 marks an encrypted member
+    _patch_zip_member(data, "deflate64.txt", 8, 10, 9)
+    _patch_zip_member(data, "encrypted.txt", 6, 8, 1)
+    path.write_bytes(bytes(data))
+
+
+def _write_tar(path):
+    with tarfile.open(path, "w:gz") as tf:
+        for name, data in [("a.txt", RESUME), ("big.txt", BIG), ("notes.md", RESUME), ("sub/z.txt", RESUME)]:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tf.addfile(info, io.BytesIO(data))
+
+
+def test_cleaned_names_do_not_collide():
+    paths = ["resumes/x.pdf", "resumes/x.txt", "other/x.pdf", "batch.zip!x.pdf", "batch.zip!sub/x.pdf"]
+    names = [cleaned_name(path) for path in paths]
+    assert len(set(names)) == len(paths)
+    assert names[0].startswith("cleaned_x.pdf_") and names[1].startswith("cleaned_x.txt_")
+    assert all("!" not in name and "/" not in name for name in names)
+    assert cleaned_name("resumes/x.pdf") == names[0]
+
+
+def test_write_cleaned_keeps_every_document(tmp_path):
+    for path, text in [("Bulli_raju_Resume.pdf", "from pdf"), ("Bulli_raju_Resume.txt", "from txt")]:
+        write_cleaned(IngestResult(path, "ok", text), str(tmp_path))
+    assert sorted(p.read_text() for p in tmp_path.iterdir()) == ["from pdf", "from txt"]
+
+
+def test_bad_zip_members_do_not_stop_the_archive(tmp_path):
+    path = tmp_path / "batch.zip"
+    _write_zip(path)
+    members = {name: (data, error) for name, data, error in iter_archive_members(str(path), 1024)}
+    assert sorted(members) == ["a.txt", "big.txt", "corrupt.txt", "deflate64.txt", "encrypted.txt", "z.txt"]
+    assert members["a.txt"] == (RESUME, None) and members["z.txt"] == (RESUME, None)
+    assert members["big.txt"] == (None, None)
+    assert members["corrupt.txt"][1].startswith("error:")
+    assert members["deflate64.txt"][1].startswith("NotImplementedError:")
+    assert members["encrypted.txt"][1].startswith("RuntimeError:")
+
+
+def test_tar_members_are_read_in_order(tmp_path):
+    path = tmp_path / "batch.tar.gz"
+    _write_tar(path)
+    assert list(iter_archive_members(str(path), 1024)) == [
+        ("a.txt", RESUME, None), ("big.txt", None, None), ("sub/z.txt", RESUME, None)]
+
+
+def test_bulk_run_reports_every_archive_member(tmp_path):
+    _write_zip(tmp_path / "batch.zip")
+    _write_tar(tmp_path / "batch.tar.gz")
+    (tmp_path / "broken.zip").write_bytes(b"PK\x03\x04 not a zip")
+    ingestor = BulkIngestor(workers=1, max_file_mb=1024 / (1024 * 1024))
+    statuses = {}
+    for result in ingestor.run([str(tmp_path)]):
+        statuses[os.path.relpath(result.path, tmp_path)] = result.status
+    assert statuses == {
+        "batch.tar.gz!a.txt": "ok", "batch.tar.gz!big.txt": "too_large", "batch.tar.gz!sub/z.txt": "ok",
+        "batch.zip!a.txt": "ok", "batch.zip!big.txt": "too_large", "batch.zip!corrupt.txt": "error",
+        "batch.zip!deflate64.txt": "error", "batch.zip!encrypted.txt": "error", "batch.zip!z.txt": "ok",
+        "broken.zip": "error",
+    }
+    assert ingestor.report.total == len(statuses)
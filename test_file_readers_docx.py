@@ -0,0 +1,53 @@
+import io
+import zipfile
+
+from file_readers_docx import iter_docx_paragraphs, read_docx
+
+W = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+MC = 'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006"'
+
+
+def paragraph(text):
+    return f"<w:p><w:r><w:t>{text}</w:t></w:r></w:p>"
+
+
+def build_docx(body, header=None, footer=None):
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        zf.writestr("word/document.xml", f"<w:document {W} {MC}><w:body>{body}</w:body></w:document>")
+        if header:
+            zf.writestr("word/header1.xml", f"<w:hdr {W}>{header}</w:hdr>")
+        if footer:
+            zf.writestr("word/footer1.xml", f"<w:ftr {W}>{footer}</w:ftr>")
+    return buf.getvalue()
+
+
+def test_bundled_docx_matches_python_docx_body():
+    body = list(iter_docx_paragraphs("Bulli_raju_Resume3.docx", engine="python-docx"))
+    streamed = list(iter_docx_paragraphs("Bulli_raju_Resume3.docx"))
+    assert body
+    # Every body paragraph comes out, in order; extra parts may add more
+    it = iter(streamed)
+    assert all(any(text == p for p in it) for text in body)
+
+
+def test_blank_docx_is_empty():
+    assert read_docx("blank.docx") == ""
+
+
+def test_headers_tables_and_text_boxes():
+    table = ("<w:tbl><w:tr>"
+             f"<w:tc>{paragraph('Python')}</w:tc><w:tc>{paragraph('SQL')}</w:tc>"
+             "</w:tr></w:tbl>")
+    text_box = ("<w:p><w:r><mc:AlternateContent><mc:Choice>"
+                f"<w:txbxContent>{paragraph('Box text')}</w:txbxContent>"
+                "</mc:Choice><mc:Fallback>"
+                f"<w:txbxContent>{paragraph('Box text')}</w:txbxContent>"
+                "</mc:Fallback></mc:AlternateContent></w:r></w:p>")
+    tabbed = ('<w:p><w:pPr><w:tabs><w:tab w:val="left" w:pos="720"/></w:tabs></w:pPr>'
+              "<w:r><w:t>Skills</w:t><w:tab/><w:t>Go</w:t><w:br/><w:t>Rust</w:t></w:r></w:p>")
+    data = build_docx(paragraph("Summary") + table + text_box + tabbed + "<w:p/>",
+                      header=paragraph("Jane Doe"), footer=paragraph("Page 1"))
+    assert list(iter_docx_paragraphs(data)) == [
+        "Jane Doe", "Summary", "Python", "SQL", "Box text", "Skills\tGo\nRust", "Page 1"]
+    assert read_docx(io.BytesIO(data)) == "Jane Doe\nSummary\nPython\nSQL\nBox text\nSkills\tGo\nRust\nPage 1"
@@ -0,0 +1,94 @@
+import io
+
+import pypdfium2 as pdfium
+import pytest
+
+import bulk_ingest
+import file_readers_pdf
+from bench_pdf_modes import build_corpus
+from file_readers_pdf import PARALLEL_MIN_PAGES, _probe_indices, is_image_only_pdf, read_pdf
+
+
+def _scanned_page(pdf):
+    # A page carrying one image and no text layer, like a scanner's output
+    page = pdf.new_page(200, 200)
+    image = pdfium.PdfImage.new(pdf)
+    bitmap = pdfium.PdfBitmap.new_native(4, 4, pdfium.raw.FPDFBitmap_BGR)
+    bitmap.fill_rect((0, 0, 0, 255), 0, 0, 4, 4)
+    image.set_bitmap(bitmap)
+    image.set_matrix(pdfium.PdfMatrix().scale(100, 100))
+    page.insert_obj(image)
+    page.gen_content()
+
+
+def _build_pdf(scanned_pages, text_pdf=None):
+    pdf = pdfium.PdfDocument.new()
+    for _ in range(scanned_pages):
+        _scanned_page(pdf)
+    if text_pdf:
+        pdf.import_pages(pdfium.PdfDocument(text_pdf))
+    buf = io.BytesIO()
+    pdf.save(buf)
+    return buf.getvalue()
+
+
+@pytest.mark.parametrize("mode", ["fast", "pdfminer"])
+def test_alternative_backends_read_the_resume(mode):
+    text = read_pdf("Bulli_raju_Resume.pdf", workers=1, mode=mode)
+    # pdfium's CRLF line ends and U+FFFE soft hyphens are translated
+    assert "\r" not in text and "\ufffe" not in text
+    for skill in ("Python", "Java", "JavaScript", "HTML", "CSS", "SQLite"):
+        assert skill in text, skill
+    # Line structure survives, the text is not run together
+    assert text.count("\n") >= read_pdf("Bulli_raju_Resume.pdf", workers=1).count("\n") // 2
+
+
+def test_probe_pages_spread_across_document():
+    assert list(_probe_indices(5, None)) == [0, 1, 2, 3, 4]
+    assert list(_probe_indices(3, 5)) == [0, 1, 2]
+    assert list(_probe_indices(9, 3)) == [0, 4, 8]
+
+
+def test_scanned_cover_page_keeps_the_text_after_it():
+    data = _build_pdf(2, "Bulli_raju_Resume.pdf")
+    assert not is_image_only_pdf(data)
+    # Looking at the leading pages alone would have called it scanned
+    assert is_image_only_pdf(data, probe_pages=1)
+    # The scanned pages contribute empty pages ahead of the text
+    assert read_pdf(data, workers=1) == "\n\n" + read_pdf("Bulli_raju_Resume.pdf", workers=1)
+
+
+def test_fully_scanned_pdf_reads_as_empty():
+    data = _build_pdf(3)
+    assert is_image_only_pdf(data)
+    assert read_pdf(data, workers=1) == ""
+
+
+def test_bulk_ingest_checks_for_scans_once(monkeypatch):
+    calls = []
+
+    def counting(source, probe_pages=None):
+        calls.append(probe_pages)
+        return is_image_only_pdf(source, probe_pages)
+
+    monkeypatch.setattr(bulk_ingest, "is_image_only_pdf", counting)
+    monkeypatch.setattr(file_readers_pdf, "is_image_only_pdf", counting)
+    with open("Bulli_raju_Resume.pdf", "rb") as f:
+        result = bulk_ingest.ingest_file("resume.pdf", f.read())
+    assert result.status == "ok"
+    assert len(calls) == 1
+
+    calls.clear()
+    assert bulk_ingest.ingest_file("scan.pdf", _build_pdf(2)).status == "needs_ocr"
+    assert len(calls) == 1
+
+
+def test_process_pool_matches_serial_read(tmp_path):
+    path, = build_corpus(str(tmp_path), [max(30, PARALLEL_MIN_PAGES)])
+    with open(path, "rb") as f:
+        data = f.read()
+    serial = read_pdf(path, workers=1)
+    assert serial.strip()
+    assert read_pdf(path, workers=4) == serial
+    assert read_pdf(data, workers=4) == serial
+    assert read_pdf(io.BytesIO(data), workers=4) == serial
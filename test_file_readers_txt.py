@@ -0,0 +1,47 @@
+from file_readers_txt import iter_txt_chunks, iter_txt_lines, read_txt
+from txt_cleaner import normalize_text
+
+
+def write(tmp_path, data, name="resume.txt"):
+    path = tmp_path / name
+    path.write_bytes(data)
+    return str(path)
+
+
+def test_crlf_and_cr_newlines_are_translated(tmp_path):
+    path = write(tmp_path, b"Skills\r\nPython\r\nOld Mac\rline\r\n")
+    assert read_txt(path) == "Skills\nPython\nOld Mac\nline\n"
+    assert normalize_text(read_txt(path)) == "Skills\nPython\nOld Mac\nline"
+    assert read_txt(b"a\r\nb") == "a\nb"
+
+
+def test_crlf_split_across_chunks(tmp_path):
+    path = write(tmp_path, b"ab\r\ncd\r\n" * 50)
+    for size in (1, 2, 3, 7):
+        assert "".join(iter_txt_chunks(path, chunk_size=size)) == "ab\ncd\n" * 50
+    assert list(iter_txt_lines(path, chunk_size=3))[:2] == ["ab", "cd"]
+
+
+def test_latin1_file_is_decoded_as_a_whole(tmp_path):
+    # "\xc3\xa9" would be "é" in UTF-8, but the stray "\xe9" makes the file latin-1
+    data = "café Ã© résumé\n".encode("latin-1")
+    path = write(tmp_path, data)
+    expected = "café Ã© résumé\n"
+    assert read_txt(path) == expected
+    assert read_txt(data) == expected
+    for size in (1, 4, 64 * 1024):
+        assert "".join(iter_txt_chunks(path, chunk_size=size)) == expected
+
+
+def test_utf8_with_multibyte_characters_across_chunks(tmp_path):
+    text = "naïve résumé – 履歴書\n" * 20
+    path = write(tmp_path, text.encode("utf-8"))
+    assert read_txt(path) == text
+    for size in (1, 2, 5):
+        assert "".join(iter_txt_chunks(path, chunk_size=size)) == text
+    assert "".join(iter_txt_chunks(memoryview(text.encode("utf-8")), chunk_size=3)) == text
+
+
+def test_utf16_with_bom(tmp_path):
+    path = write(tmp_path, "Skills\r\nGo\r\n".encode("utf-16"))
+    assert read_txt(path) == "Skills\nGo\n"
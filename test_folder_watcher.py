@@ -0,0 +1,84 @@
+import os
+
+import folder_watcher
+from bulk_ingest import IngestResult
+from folder_watcher import FolderWatcher
+
+
+class FakeIngestor:
+    """Stands in for BulkIngestor: reports a preset status per file name"""
+
+    def __init__(self, statuses=None):
+        self.statuses = statuses or {}
+        self.seen = []
+
+    def run(self, paths):
+        for path in paths:
+            self.seen.append(os.path.basename(path))
+            yield IngestResult(path, self.statuses.get(os.path.basename(path), "ok"))
+
+
+def make_watcher(tmp_path, ingestor):
+    inbox = tmp_path / "inbox"
+    inbox.mkdir(exist_ok=True)
+    return inbox, FolderWatcher(str(inbox), ingestor, str(tmp_path / "manifest.json"), settle_seconds=0)
+
+
+def scan(watcher):
+    watcher.ingestor.seen = []
+    list(watcher.scan_once())
+    return sorted(watcher.ingestor.seen)
+
+
+def test_unchanged_files_are_skipped(tmp_path):
+    inbox, watcher = make_watcher(tmp_path, FakeIngestor())
+    (inbox / "a.txt").write_text("Python")
+    (inbox / "b.txt").write_text("SQL")
+    assert scan(watcher) == ["a.txt", "b.txt"]
+    assert scan(watcher) == []
+    # Touched without a content change: still skipped
+    os.utime(inbox / "a.txt", ns=(0, 10 ** 18))
+    assert scan(watcher) == []
+    (inbox / "b.txt").write_text("SQL, Go")
+    assert scan(watcher) == ["b.txt"]
+    # A new watcher reads the same manifest
+    _, restarted = make_watcher(tmp_path, FakeIngestor())
+    assert scan(restarted) == []
+
+
+def test_permanent_failures_wait_for_a_change(tmp_path):
+    inbox, watcher = make_watcher(tmp_path, FakeIngestor({"scan.pdf": "needs_ocr"}))
+    (inbox / "scan.pdf").write_bytes(b"%PDF-1.4")
+    assert scan(watcher) == ["scan.pdf"]
+    assert scan(watcher) == []
+
+
+def test_transient_failures_are_retried_with_backoff(tmp_path, monkeypatch):
+    ingestor = FakeIngestor({"slow.txt": "timeout"})
+    inbox, watcher = make_watcher(tmp_path, ingestor)
+    (inbox / "slow.txt").write_text("Python")
+    assert scan(watcher) == ["slow.txt"]
+    # Still inside the backoff window
+    assert scan(watcher) == []
+
+    monkeypatch.setattr(folder_watcher, "RETRY_BASE_SECONDS", 0)
+    entry = watcher.manifest.files[str(inbox / "slow.txt")]
+    entry["retry_after"] = 0
+    assert scan(watcher) == ["slow.txt"]
+    assert watcher.manifest.files[str(inbox / "slow.txt")]["attempts"] == 2
+
+    ingestor.statuses = {}
+    assert scan(watcher) == ["slow.txt"]
+    assert watcher.manifest.files[str(inbox / "slow.txt")]["status"] == "ok"
+    assert scan(watcher) == []
+
+
+def test_backoff_doubles_up_to_the_cap(tmp_path):
+    _, watcher = make_watcher(tmp_path, FakeIngestor())
+    stat = os.stat(tmp_path)
+    delays = []
+    for _ in range(8):
+        watcher.manifest.record("x.txt", stat, "same", "error", now=0)
+        delays.append(watcher.manifest.files["x.txt"]["retry_after"])
+    assert delays[:3] == [60, 120, 240]
+    assert delays[-1] == folder_watcher.RETRY_MAX_SECONDS
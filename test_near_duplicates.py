@@ -0,0 +1,94 @@
+import random
+
+import numpy as np
+import pytest
+
+import near_duplicates
+from bulk_ingest import BulkIngestor, IngestResult
+from near_duplicates import NearDuplicateIndex, shingles
+
+WORDS = [f"word{i}" for i in range(400)]
+
+
+def _document(seed, n_words=300):
+    rng = random.Random(seed)
+    return " ".join(rng.choice(WORDS) for _ in range(n_words))
+
+
+def _reworded(text, n_changes):
+    words = text.split()
+    for i in range(n_changes):
+        words[(i * 37) % len(words)] = f"changed{i}"
+    return " ".join(words)
+
+
+def test_shingles():
+    assert shingles("") == set()
+    assert shingles("Python  SQL", size=5) == {"python sql"}
+    assert shingles("a b c d", size=3) == {"a b c", "b c d"}
+
+
+def test_signature_is_the_same_in_blocks(monkeypatch):
+    index = NearDuplicateIndex()
+    text = _document(1, 2000)
+    whole = index.signature(text)
+    monkeypatch.setattr(near_duplicates, "SIGNATURE_BLOCK", 7)
+    assert np.array_equal(index.signature(text), whole)
+    assert (index.signature("") == near_duplicates._PRIME).all()
+
+
+def test_threshold():
+    index = NearDuplicateIndex(threshold=0.8)
+    original = _document(1)
+    index.add("original", original)
+    match = index.find(_reworded(original, 2))
+    assert match is not None and match[0] == "original" and 0.8 <= match[1] < 1.0
+    assert index.find(_reworded(original, 60)) is None
+    assert index.find(_document(2)) is None
+
+
+def test_exact_copy_skips_the_signature(monkeypatch):
+    index = NearDuplicateIndex()
+    text = _document(3)
+    index.add("first", text)
+
+    def fail(_):
+        raise AssertionError("signature computed for an exact copy")
+
+    monkeypatch.setattr(index, "signature", fail)
+    assert index.find(text) == ("first", 1.0)
+
+
+def test_check_and_add_keeps_the_first_original():
+    index = NearDuplicateIndex()
+    text = _document(4)
+    assert index.check_and_add("a", text) is None
+    assert index.check_and_add("b", text) == ("a", 1.0)
+    assert index.check_and_add("c", _document(5)) is None
+    assert len(index) == 2
+
+
+def test_bulk_dedup_reuses_the_earlier_analysis():
+    analyzed = []
+
+    def analyze(text):
+        analyzed.append(text)
+        return {"words": len(text.split())}
+
+    ingestor = BulkIngestor(workers=1, dedup=NearDuplicateIndex(threshold=0.8), analyze=analyze)
+    original = _document(6)
+    results = [IngestResult("a.txt", "ok", original), IngestResult("b.txt", "ok", _reworded(original, 2)),
+               IngestResult("c.txt", "ok", _document(7)), IngestResult("d.txt", "error")]
+    for result in results:
+        ingestor._post_process(result)
+        ingestor.report.add(result)
+
+    a, b, c, d = results
+    assert analyzed == [a.cleaned_text, c.cleaned_text]
+    assert b.duplicate_of == "a.txt" and b.similarity >= 0.8
+    assert b.analysis is a.analysis
+    assert not c.duplicate_of and d.analysis is None
+    report = ingestor.report
+    assert (report.duplicates, report.analyzed) == (1, 2)
+    assert report.analysis_seconds_saved == pytest.approx(report.analysis_seconds / 2)
+    assert "1 near-duplicates reused earlier results, skipping" in report.summary()
@@ -0,0 +1,93 @@
+import random
+
+from offset_map import OffsetMap, apply_edits
+from pipeline import clean_with_offsets
+from remove_personal import remove_personal
+from txt_cleaner import normalize_text, normalize_text_with_offsets
+
+FRAGMENTS = [
+    "a", "Python", "a@b.com", "https://x.io/p", "+91 98765 43210", "Jan 5, 2020", " ", "  ", "\t",
+    "\r\n", "\n", "caf\u00e9", "\ufb01le", "\u00a0", "\u2022", " \u2022 ", "\u2013", "\u2019", "x\u200b",
+]
+
+
+def random_edits(rng, length):
+    edits = []
+    pos = rng.randint(0, 3)
+    while pos <= length:
+        end = min(length, pos + rng.randint(0, 3))
+        edits.append((pos, end, "#" * rng.randint(0, 3)))
+        pos = end + rng.randint(0, 3)
+        if edits[-1][:2] == (pos, pos):
+            pos += 1
+    return edits
+
+
+def origins(text, edits):
+    """Original index of each copied output character, None inside replacements"""
+    result = []
+    pos = 0
+    for start, end, replacement in edits:
+        result += list(range(pos, start)) + [None] * len(replacement)
+        pos = end
+    return result + list(range(pos, len(text)))
+
+
+def test_apply_edits():
+    text, offsets = apply_edits("call 555-1234 now", [(5, 13, "[PHONE]")])
+    assert text == "call [PHONE] now"
+    assert offsets.span_to_original(0, 4) == (0, 4)
+    assert offsets.span_to_original(5, 12) == (5, 13)
+    assert offsets.span_to_original(13, 16) == (14, 17)
+    assert len(offsets) == 3
+
+
+def test_identity_and_deletions():
+    offsets = OffsetMap.identity(5)
+    assert [offsets.to_original(i) for i in range(6)] == [0, 1, 2, 3, 4, 5]
+    text, offsets = apply_edits("  ab  ", [(0, 2, ""), (4, 6, "")])
+    assert text == "ab"
+    assert offsets.span_to_original(0, 2) == (2, 4)
+
+
+def test_composed_maps_match_character_origins():
+    rng = random.Random(25)
+    for _ in range(3000):
+        text = "".join(rng.choice("abc") for _ in range(rng.randint(0, 15)))
+        first_edits = random_edits(rng, len(text))
+        middle, first = apply_edits(text, first_edits)
+        second_edits = random_edits(rng, len(middle))
+        result, second = apply_edits(middle, second_edits)
+        composed = first.compose(second)
+        first_origins = origins(text, first_edits)
+        positions = [composed.to_original(i) for i in range(len(result) + 1)]
+        assert positions == sorted(positions)
+        for i, mid in enumerate(origins(middle, second_edits)):
+            if mid is not None and first_origins[mid] is not None:
+                assert composed.span_to_original(i, i + 1) == (first_origins[mid], first_origins[mid] + 1)
+
+
+def test_cleaning_with_offsets_matches_cleaning():
+    rng = random.Random(26)
+    for _ in range(2000):
+        text = "".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 30)))
+        normalized, offsets = normalize_text_with_offsets(text)
+        assert normalized == normalize_text(text), repr(text)
+        assert (offsets.clean_length, offsets.orig_length) == (len(normalized), len(text))
+        cleaned, offsets = clean_with_offsets(text)
+        assert cleaned == normalize_text(remove_personal(text)), repr(text)
+        start = cleaned.find("Python")
+        if start >= 0:
+            orig_start, orig_end = offsets.span_to_original(start, start + len("Python"))
+            assert text[orig_start:orig_end] == "Python"
+
+
+def test_bundled_resume_spans_map_back():
+    with open("Bulli_raju_Resume.txt", "r", encoding="utf-8") as f:
+        raw = f.read()
+    cleaned, offsets = clean_with_offsets(raw)
+    assert len(offsets) < 200
+    for word in ["Python", "Bootstrap", "SQLite", "Leadership"]:
+        start = cleaned.find(word)
+        orig_start, orig_end = offsets.span_to_original(start, start + len(word))
+        assert raw[orig_start:orig_end] == word
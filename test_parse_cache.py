@@ -0,0 +1,54 @@
+import os
+import stat
+
+import parse_cache
+from parse_cache import ParseCache
+
+ENTRY = ("Email: a@b.com", "Email: [EMAIL]", ".txt")
+
+
+def test_memory_only_by_default(tmp_path, monkeypatch):
+    monkeypatch.delenv(parse_cache.CACHE_DIR_ENV, raising=False)
+    monkeypatch.setattr(parse_cache, "_default_cache", None)
+    cache = parse_cache.get_default_cache()
+    assert cache.cache_dir is None
+    key = ParseCache.make_key(b"doc", "1")
+    cache.put(key, ENTRY)
+    assert cache.get(key) == ENTRY
+
+
+def test_disk_entries_are_private(tmp_path):
+    cache_dir = tmp_path / "cache"
+    cache = ParseCache(str(cache_dir))
+    key = ParseCache.make_key(b"doc", "1")
+    cache.put(key, ENTRY)
+    assert stat.S_IMODE(os.stat(cache_dir).st_mode) == 0o700
+    [path] = cache_dir.iterdir()
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+    # A new process reads the entry back from disk
+    assert ParseCache(str(cache_dir)).get(key) == ENTRY
+
+
+def test_existing_directory_is_made_private(tmp_path):
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir(mode=0o755)
+    os.chmod(cache_dir, 0o755)
+    ParseCache(str(cache_dir))
+    assert stat.S_IMODE(os.stat(cache_dir).st_mode) == 0o700
+
+
+def test_prune_skips_files_removed_during_scan(tmp_path, monkeypatch):
+    cache = ParseCache(str(tmp_path / "cache"))
+    for i in range(3):
+        cache.put(ParseCache.make_key(b"doc%d" % i, "1"), ENTRY)
+    cache.max_disk_bytes = 1
+    real_scandir = os.scandir
+
+    def scandir_then_delete(path):
+        entries = list(real_scandir(path))
+        os.remove(entries[0].path)
+        return iter(entries)
+
+    monkeypatch.setattr(parse_cache.os, "scandir", scandir_then_delete)
+    cache._prune_disk()
+    assert list(real_scandir(cache.cache_dir)) == []
@@ -0,0 +1,49 @@
+import pytest
+
+from file_readers_txt import CHUNK_SIZE
+from parser_pipeline import DocumentParser, NeedsOCRError
+from pipeline import read_any
+from remove_personal import remove_personal
+from test_file_readers_pdf import _build_pdf
+from txt_cleaner import normalize_text
+
+
+def test_iter_text_auto_redacts_across_chunk_boundaries(tmp_path):
+    email = "john.doe@gmail.com"
+    phone = "+91 98765 43210"
+    # The email straddles the first TXT chunk boundary, the phone number the second
+    text = "x" * (CHUNK_SIZE - 8) + " " + email + "\nSkills  Python\n"
+    text += "y" * (2 * CHUNK_SIZE - 6 - len(text) - 1) + " " + phone + " end\n"
+    assert text.index(email) < CHUNK_SIZE < text.index(email) + len(email)
+    assert text.index(phone) < 2 * CHUNK_SIZE < text.index(phone) + len(phone)
+    path = tmp_path / "resume.txt"
+    path.write_text(text, encoding="utf-8")
+
+    streamed = "".join(DocumentParser().iter_text_auto(str(path)))
+    assert "john" not in streamed and "+91" not in streamed
+    assert streamed == normalize_text(remove_personal(read_any(str(path))))
+
+
+def test_char_budget_applies_to_pdfs_only():
+    parser = DocumentParser(max_chars=100)
+    text = "Skills\n" + "Python SQL Docker\n" * 50
+    raw, _, _ = parser.extract_text_bytes(text.encode("utf-8"), "resume.txt")
+    assert raw == text
+    with open("Bulli_raju_Resume.pdf", "rb") as f:
+        raw, _, _ = parser.extract_text_bytes(f.read(), "resume.pdf")
+    assert len(raw) == 100
+
+
+def test_iter_text_auto_matches_extract_text_auto_for_pdfs():
+    parser = DocumentParser()
+    _, cleaned, _ = parser.extract_text_auto("Bulli_raju_Resume.pdf")
+    assert "".join(parser.iter_text_auto("Bulli_raju_Resume.pdf")) == cleaned
+
+
+@pytest.mark.parametrize("parser", [DocumentParser(), DocumentParser(max_pages=2),
+                                    DocumentParser(timeout=30, workers=1)])
+def test_scanned_pdf_raises_needs_ocr(parser):
+    with pytest.raises(NeedsOCRError):
+        parser.extract_text_bytes(_build_pdf(2), "scan.pdf")
+    raw, _, _ = parser.extract_text_bytes(_build_pdf(1, "Bulli_raju_Resume.pdf"), "resume.pdf")
+    assert "Python" in raw
@@ -0,0 +1,79 @@
+import pypdfium2 as pdfium
+import pytest
+
+import pdf_backend_policy
+from file_readers_pdf import read_pdf
+from pdf_backend_policy import DEFAULT_POLICY, choose_mode, document_class, document_features, load_policy
+
+POLICY = {
+    "producers": {"latex": ["pdftex", "xetex"], "word": ["microsoft", "word"]},
+    "fragmented_chars_per_object": 2.0,
+    "long_document_pages": 20,
+    "modes": {"latex": "pdfminer", "word": "layout", "fragmented": "layout"},
+    "long_modes": {"other": "fast", "latex": "fast"},
+    "default_mode": "layout",
+}
+
+
+def _features(producer="", pages=2, chars_per_object=10.0):
+    return {"producer": producer, "pages": pages, "chars_per_object": chars_per_object}
+
+
+@pytest.mark.parametrize("features, doc_class", [
+    (_features("pdfTeX-1.40.21 LaTeX with hyperref"), "latex"),
+    (_features("Microsoft® Word for Microsoft 365"), "word"),
+    (_features("Canva"), "other"),
+    (_features(""), "other"),
+    # Few characters per text object wins over the producer
+    (_features("Microsoft Word", chars_per_object=1.2), "fragmented"),
+    # No text objects at all is not evidence of fragmentation
+    (_features("Microsoft Word", chars_per_object=0.0), "word"),
+])
+def test_document_class(features, doc_class):
+    assert document_class(features, POLICY) == doc_class
+
+
+def test_choose_mode():
+    assert choose_mode(_features("xetex"), POLICY) == "pdfminer"
+    assert choose_mode(_features("xetex", pages=20), POLICY) == "fast"
+    assert choose_mode(_features("Word", pages=40), POLICY) == "layout"
+    assert choose_mode(_features("Canva"), POLICY) == "layout"
+    assert choose_mode(_features("Canva", pages=25), POLICY) == "fast"
+    assert choose_mode(_features("Word", chars_per_object=1.0), POLICY) == "layout"
+
+
+def test_default_policy_always_picks_layout():
+    for features in (_features("xetex", pages=100), _features("", chars_per_object=1.0)):
+        assert choose_mode(features, dict(DEFAULT_POLICY)) == "layout"
+
+
+def test_missing_or_broken_policy_falls_back(tmp_path):
+    assert load_policy(str(tmp_path / "missing.json")) == DEFAULT_POLICY
+    broken = tmp_path / "broken.json"
+    broken.write_text("{not json", encoding="utf-8")
+    assert load_policy(str(broken)) == DEFAULT_POLICY
+    partial = tmp_path / "partial.json"
+    partial.write_text('{"default_mode": "fast"}', encoding="utf-8")
+    assert load_policy(str(partial)) == dict(DEFAULT_POLICY, default_mode="fast")
+
+
+def test_bundled_policy_loads():
+    policy = load_policy()
+    assert set(policy) == set(DEFAULT_POLICY)
+    assert all(mode in ("layout", "fast", "pdfminer") for mode in policy["modes"].values())
+
+
+def test_auto_mode_reads_with_the_chosen_backend(monkeypatch):
+    pdf = pdfium.PdfDocument("Bulli_raju_Resume.pdf")
+    try:
+        features = document_features(pdf)
+    finally:
+        pdf.close()
+    assert features["pages"] == 2 and features["chars_per_object"] > 0
+    expected = read_pdf("Bulli_raju_Resume.pdf", workers=1, mode=choose_mode(features))
+    assert read_pdf("Bulli_raju_Resume.pdf", workers=1, mode="auto") == expected
+
+    forced = dict(DEFAULT_POLICY, default_mode="fast")
+    monkeypatch.setattr(pdf_backend_policy, "load_policy", lambda path=None: forced)
+    assert read_pdf("Bulli_raju_Resume.pdf", workers=1, mode="auto") == \
+        read_pdf("Bulli_raju_Resume.pdf", workers=1, mode="fast")
@@ -0,0 +1,83 @@
+import pytest
+
+import bulk_ingest
+import pipeline
+from preflight import (BINARY, EMPTY, TOO_LARGE, TRUNCATED, TYPE_MISMATCH, UNSUPPORTED,
+                       PreflightError, detect_type, preflight)
+
+
+def _read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _reason(data, file_name, max_bytes=None):
+    with pytest.raises(PreflightError) as info:
+        preflight(data, file_name, max_bytes)
+    return info.value.reason
+
+
+def test_magic_bytes():
+    assert detect_type(_read("Bulli_raju_Resume.pdf")[:4096]) == ".pdf"
+    assert detect_type(_read("Bulli_raju_Resume3.docx")[:4096]) == ".docx"
+    assert detect_type(b"Skills: Python") is None
+    # A PDF signature counts only at the start of the file
+    assert detect_type(b"Notes on the %PDF-1.7 format") is None
+
+
+def test_bundled_files_pass():
+    assert preflight("Bulli_raju_Resume.pdf") == ".pdf"
+    assert preflight("Bulli_raju_Resume3.docx") == ".docx"
+    assert preflight("Bulli_raju_Resume.txt") == ".txt"
+    assert preflight(memoryview(_read("Bulli_raju_Resume.pdf")), "Resume.PDF") == ".pdf"
+
+
+def test_text_mentioning_pdf_header_is_text():
+    assert preflight(b"Worked on parsers for %PDF-1.4 files\n", "resume.txt") == ".txt"
+
+
+def test_pdf_header_after_junk_is_accepted():
+    assert preflight(b"\r\n" + _read("Bulli_raju_Resume.pdf"), "resume.pdf") == ".pdf"
+
+
+def test_mismatched_types():
+    pdf, docx = _read("Bulli_raju_Resume.pdf"), _read("Bulli_raju_Resume3.docx")
+    assert _reason(pdf, "resume.docx") == TYPE_MISMATCH
+    assert _reason(docx, "resume.pdf") == TYPE_MISMATCH
+    assert _reason(pdf, "resume.txt") == TYPE_MISMATCH
+    assert _reason(b"plain text", "resume.pdf") == TYPE_MISMATCH
+    assert _reason(b"text\0with\0nul", "resume.txt") == BINARY
+    assert _reason(b"", "resume.txt") == EMPTY
+    assert _reason(pdf, "resume.odt") == UNSUPPORTED
+
+
+def test_truncated_files():
+    pdf, docx = _read("Bulli_raju_Resume.pdf"), _read("Bulli_raju_Resume3.docx")
+    assert _reason(pdf[:len(pdf) // 2], "resume.pdf") == TRUNCATED
+    assert _reason(docx[:len(docx) // 2], "resume.docx") == TRUNCATED
+    # End record intact but the central directory it points to is gone
+    eocd = docx.rfind(b"PK\x05\x06")
+    assert _reason(docx[:eocd - 10] + docx[eocd:], "resume.docx") == TRUNCATED
+
+
+def test_size_limit():
+    data = b"Skills: Python\n" * 100
+    assert preflight(data, "resume.txt", max_bytes=len(data)) == ".txt"
+    assert _reason(data, "resume.txt", max_bytes=len(data) - 1) == TOO_LARGE
+
+
+def test_bulk_ingest_runs_preflight_once(monkeypatch, tmp_path):
+    calls = []
+
+    def counting(*args, **kwargs):
+        calls.append(args[1] if len(args) > 1 else args[0])
+        return preflight(*args, **kwargs)
+
+    monkeypatch.setattr(bulk_ingest, "preflight", counting)
+    monkeypatch.setattr(pipeline, "preflight", counting)
+    path = tmp_path / "resume.txt"
+    path.write_text("Skills\nPython\n", encoding="utf-8")
+    ingestor = bulk_ingest.BulkIngestor(workers=1)
+    assert ingestor._preflight(str(path)) is None
+    assert bulk_ingest._ingest_job((str(path), None)).status == "ok"
+    assert calls == [str(path)]
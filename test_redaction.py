@@ -0,0 +1,81 @@
+import random
+import re
+
+from redaction import RedactionRule, Redactor
+from remove_personal import (EMAIL_PATTERN, PHONE_PATTERN, remove_personal, remove_personal_sequential,
+                             scan_emails, scan_phones)
+
+# Fragments that exercise every rule and the places where they meet
+FRAGMENTS = [
+    "a", "Python", "x.y", "@", "a@b.com", "me@mail.example.org,", "http", "https://x.io/p?q=1",
+    "www.", "www.site.com", "1", "12", "2020", "+91", "98765", "-", "/", " ", "  ", "\n", "\t",
+    "Jan", "march", "Sept", "12,", "05/2021", "2019-04-01", "(", ")", "[", "]", "_", "é", "١٢",
+]
+
+
+def random_text(rng, n_fragments):
+    return "".join(rng.choice(FRAGMENTS) for _ in range(n_fragments))
+
+
+def test_matches_sequential_on_examples():
+    samples = [
+        "",
+        "no personal data here",
+        "Email: john.doe@gmail.com Phone: +91 98765 43210",
+        "Portfolio https://github.com/john and www.john.dev, since Jan 5, 2020",
+        "Worked 01/2019 - 03/2021 and 2018-06-15; call 555-123-4567 or 555 123 4567",
+        "mail@host.com12/2020 http://a.b/c@d.e 123456789 12-2020",
+        "Dates: March 3 2021, sep 14, 2019, 7/21\nTable: 1 2 3 4 5 6 7 8 9 10",
+    ]
+    for text in samples:
+        assert remove_personal(text) == remove_personal_sequential(text), text
+
+
+def test_matches_sequential_on_random_text():
+    rng = random.Random(19)
+    for _ in range(3000):
+        text = random_text(rng, rng.randint(0, 40))
+        assert remove_personal(text) == remove_personal_sequential(text), repr(text)
+
+
+def test_matches_sequential_on_bundled_resume():
+    with open("Bulli_raju_Resume.txt", "r", encoding="utf-8") as f:
+        text = f.read()
+    assert remove_personal(text) == remove_personal_sequential(text)
+
+
+def test_earlier_rules_take_priority():
+    redactor = Redactor([
+        RedactionRule("word", r"secret\w*", "[W]"),
+        RedactionRule("digits", r"\d+", "[D]"),
+    ])
+    assert redactor.redact("secret42 and 7") == "[W] and [D]"
+    spans = [(start, end, rule.name) for start, end, rule in redactor.spans("secret42 and 7")]
+    assert spans == [(0, 8, "word"), (13, 14, "digits")]
+
+
+def regex_spans(pattern, text):
+    return [match.span() for match in re.finditer(pattern, text)]
+
+
+def test_scanners_match_their_patterns_on_random_text():
+    rng = random.Random(20)
+    fragments = FRAGMENTS + ["@@", "..", "a@b", "@x.y", "+", "+1", "0", "7", " - ", "\u00a0", "\u2003"]
+    for _ in range(5000):
+        text = "".join(rng.choice(fragments) for _ in range(rng.randint(0, 50)))
+        assert list(scan_emails(text)) == regex_spans(EMAIL_PATTERN, text), repr(text)
+        assert list(scan_phones(text)) == regex_spans(PHONE_PATTERN, text), repr(text)
+
+
+def test_adversarial_input_matches_sequential():
+    samples = [
+        "a@" * 300,
+        "x@" + "a" * 500 + ".",
+        "1" + "- " * 400,
+        "12 - 3 - 45 -\t6 " * 50,
+        "+" + "1-" * 300,
+        "Jan " * 300,
+        "12/" * 300,
+    ]
+    for text in samples:
+        assert remove_personal(text) == remove_personal_sequential(text)
@@ -0,0 +1,51 @@
+import pytest
+
+from section_normalizer import (DEFAULT_SECTION_HEADERS, SECTION_HEADERS, compile_section_headers,
+                                has_section_header, load_section_headers, standardize_sections)
+
+
+@pytest.mark.parametrize("section, names", sorted(SECTION_HEADERS.items()))
+def test_every_spelling_maps_to_its_section(section, names):
+    for name in names:
+        assert standardize_sections(f"Intro\n{name}\nbody") == f"Intro\n=== {section} ===\nbody", name
+
+
+@pytest.mark.parametrize("line, section", [
+    ("Technical Skills:", "SKILLS"),
+    ("technical skills", "SKILLS"),
+    ("  TECHNICAL\tSKILLS .", "SKILLS"),
+    ("Tools & Technologies:", "SKILLS"),
+    ("Work  Experience", "EXPERIENCE"),
+    ("Education.", "EDUCATION"),
+    ("Academic Projects :", "PROJECTS"),
+])
+def test_case_spacing_and_punctuation_variants(line, section):
+    assert standardize_sections(f"{line}\nPython") == f"=== {section} ===\nPython"
+    assert has_section_header(f"Jane Doe\n{line}\n")
+
+
+@pytest.mark.parametrize("line", [
+    "I have strong skills in Python",
+    "Skills: Python, SQL",
+    "Education - B.Tech 2020",
+    "Work\nHistory",
+    "Projects!",
+    "Skillsets",
+    "=== SKILLS ===",
+])
+def test_non_header_lines_are_left_alone(line):
+    assert standardize_sections(line) == line
+    assert not has_section_header(line)
+
+
+def test_first_section_wins_for_a_duplicate_spelling():
+    pattern, canonical = compile_section_headers({"A": ["Tools"], "B": ["TOOLS", "Tech Stack"]})
+    assert canonical == {"TOOLS": "A", "TECH STACK": "B"}
+    assert pattern.search("tech   stack:") and not pattern.search("techstack")
+
+
+def test_missing_or_unreadable_table_falls_back(tmp_path):
+    assert load_section_headers(str(tmp_path / "missing.json")) is DEFAULT_SECTION_HEADERS
+    broken = tmp_path / "broken.json"
+    broken.write_text("{not json", encoding="utf-8")
+    assert load_section_headers(str(broken)) is DEFAULT_SECTION_HEADERS
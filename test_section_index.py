@@ -0,0 +1,39 @@
+from section_normalizer import PREAMBLE, normalize_text, normalize_text_with_sections, section_index
+
+
+def test_empty_and_headerless_text():
+    assert section_index("") == []
+    assert section_index("just a summary\nwith two lines") == [(PREAMBLE, 0, 29)]
+
+
+def test_spans_cover_section_bodies():
+    text = "Jane Doe\nTECHNICAL SKILLS\nPython, SQL\nWork Experience\nAnalyst at X\n"
+    index = section_index(text)
+    assert [name for name, _, _ in index] == [PREAMBLE, "SKILLS", "EXPERIENCE"]
+    bodies = {name: text[start:end].strip() for name, start, end in index}
+    assert bodies == {PREAMBLE: "Jane Doe", "SKILLS": "Python, SQL", "EXPERIENCE": "Analyst at X"}
+
+
+def test_blank_preamble_is_skipped():
+    assert [name for name, _, _ in section_index("\n\nSKILLS\nGo\n")] == ["SKILLS"]
+
+
+def test_offsets_refer_to_normalized_text():
+    raw = "Skills:\n  Python   and   Go\n\nEducation\n  B.Tech"
+    text, index = normalize_text_with_sections(raw)
+    assert text == normalize_text(raw)
+    assert [(name, text[start:end].strip()) for name, start, end in index] == [
+        ("SKILLS", "Python and Go"), ("EDUCATION", "B.Tech")]
+
+
+def test_bundled_resume_sections():
+    with open("Bulli_raju_Resume.txt", "r", encoding="utf-8") as f:
+        text = normalize_text(f.read())
+    index = section_index(text)
+    names = [name for name, _, _ in index]
+    assert {"EDUCATION", "SKILLS", "PROJECTS", "EXPERIENCE"} <= set(names)
+    # Spans are in order, do not overlap and never include a header line
+    for (_, _, end), (_, start, _) in zip(index, index[1:]):
+        assert end <= start
+    for name, start, end in index:
+        assert name not in text[start:end].split("\n")
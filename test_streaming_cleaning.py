@@ -0,0 +1,70 @@
+import random
+
+import remove_personal as remove_personal_module
+from remove_personal import remove_personal, iter_remove_personal
+import txt_cleaner
+from txt_cleaner import normalize_text, iter_normalize_text
+
+FRAGMENTS = [
+    "a", "Python", "a@b.com", "https://x.io/p", "www.site.com", "+91 98765 43210", "555-123-4567",
+    "Jan 5, 2020", "05/2021", "2019-04-01", "1", "-", " ", "  ", "\t", "\r\n", "\n", "café", "ﬁle", " ",
+    "•", " • ", "\u2013", "\u2019", "\u00a0\u2022",
+]
+
+
+def random_chunks(rng, text):
+    cuts = sorted(rng.sample(range(len(text) + 1), min(len(text) + 1, rng.randint(0, 12))))
+    return [text[i:j] for i, j in zip([0] + cuts, cuts + [len(text)])]
+
+
+def test_iter_remove_personal_matches_whole_text():
+    rng = random.Random(21)
+    for _ in range(2000):
+        text = "".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 40)))
+        chunks = random_chunks(rng, text)
+        assert "".join(iter_remove_personal(chunks)) == remove_personal(text), repr(chunks)
+
+
+def test_iter_normalize_text_matches_whole_text():
+    rng = random.Random(22)
+    for _ in range(2000):
+        text = "".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 40)))
+        chunks = random_chunks(rng, text)
+        assert "".join(iter_normalize_text(chunks)) == normalize_text(text), repr(chunks)
+
+
+def test_streaming_pipeline_matches_whole_text():
+    with open("Bulli_raju_Resume.txt", "r", encoding="utf-8") as f:
+        text = f.read()
+    chunks = [text[i:i + 97] for i in range(0, len(text), 97)]
+    streamed = "".join(iter_normalize_text(iter_remove_personal(chunks)))
+    assert streamed == normalize_text(remove_personal(text))
+
+
+def test_iter_remove_personal_with_small_cut_window(monkeypatch):
+    monkeypatch.setattr(remove_personal_module, "SAFE_CUT_WINDOW", 3)
+    rng = random.Random(23)
+    for _ in range(500):
+        text = "".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 40)))
+        chunks = random_chunks(rng, text)
+        assert "".join(iter_remove_personal(chunks)) == remove_personal(text), repr(chunks)
+
+
+def test_iter_remove_personal_long_run_without_cut_point(monkeypatch):
+    # Held-back chunks are joined once when cut, not once per chunk
+    text = "x" * 200000 + " Python a@b.com"
+    assert "".join(iter_remove_personal(text)) == remove_personal(text)
+    monkeypatch.setattr(remove_personal_module, "STREAM_MAX_CARRY", 1000)
+    pieces = list(iter_remove_personal(text))
+    assert "".join(pieces).startswith(text[:200000]) and "a@b.com" not in pieces[-1]
+    assert max(map(len, pieces)) <= 1001
+
+
+def test_iter_normalize_text_long_line_in_small_chunks(monkeypatch):
+    # The incomplete line is joined once, not once per chunk
+    text = "Skills  " + "x" * 400000 + "\nPython\n"
+    assert "".join(iter_normalize_text(text)) == normalize_text(text)
+    monkeypatch.setattr(txt_cleaner, "STREAM_MAX_LINE", 1000)
+    pieces = list(txt_cleaner._complete_lines(text))
+    assert "".join(pieces) == text
+    assert max(map(len, pieces)) <= 1001
@@ -0,0 +1,86 @@
+import os
+import time
+
+import pytest
+
+from supervised_worker import (CRASHED, ERROR, OK, TIMEOUT, TOO_LARGE, SupervisedPool, SupervisedWorker,
+                               resource)
+
+
+def echo(value):
+    return value
+
+
+def sleep_then_return(seconds):
+    time.sleep(seconds)
+    return "woke"
+
+
+def allocate(mb):
+    return len(bytearray(mb * 1024 * 1024))
+
+
+def fail():
+    raise ValueError("bad document")
+
+
+def die():
+    os._exit(3)
+
+
+@pytest.fixture
+def worker_factory():
+    workers = []
+
+    def make(**kwargs):
+        worker = SupervisedWorker(**kwargs)
+        workers.append(worker)
+        return worker
+
+    yield make
+    for worker in workers:
+        worker.close()
+
+
+def test_timeout_kills_and_restarts(worker_factory):
+    worker = worker_factory(timeout=0.5)
+    start = time.perf_counter()
+    status, _ = worker.run(sleep_then_return, (30,))
+    assert status == TIMEOUT
+    assert time.perf_counter() - start < 5
+    assert worker.restarts == 1
+    # The replacement worker serves the next document
+    assert worker.run(echo, ("next",)) == (OK, "next")
+
+
+@pytest.mark.skipif(resource is None, reason="RLIMIT_AS is not available")
+def test_memory_ceiling_reports_too_large(worker_factory):
+    worker = worker_factory(timeout=30, max_memory_mb=64)
+    assert worker.run(allocate, (8,)) == (OK, 8 * 1024 * 1024)
+    status, _ = worker.run(allocate, (512,))
+    assert status == TOO_LARGE
+    assert worker.restarts == 1
+    assert worker.run(allocate, (8,)) == (OK, 8 * 1024 * 1024)
+
+
+def test_errors_keep_the_worker(worker_factory):
+    worker = worker_factory(timeout=30)
+    status, value = worker.run(fail)
+    assert status == ERROR and "bad document" in value
+    assert worker.restarts == 0
+    assert worker.run(echo, (1,)) == (OK, 1)
+
+
+def test_crash_is_reported_and_worker_restarted(worker_factory):
+    worker = worker_factory(timeout=30)
+    status, value = worker.run(die)
+    assert status == CRASHED and "3" in value
+    assert worker.run(echo, (2,)) == (OK, 2)
+
+
+def test_pool_map_unordered_mixes_statuses():
+    with SupervisedPool(workers=2, timeout=0.5) as pool:
+        results = {item: status for item, status, _ in pool.map_unordered(sleep_then_return, [0, 30, 0.01])}
+        assert results == {0: OK, 30: TIMEOUT, 0.01: OK}
+        assert pool.restarts == 1
+        assert pool.run(echo, "after") == (OK, "after")
@@ -0,0 +1,26 @@
+import random
+
+from txt_cleaner import normalize_text, normalize_text_nfkd
+
+
+def test_ascii_text_is_unchanged_by_the_fast_path():
+    rng = random.Random(24)
+    alphabet = "ab1 -@.\t\r\n|"
+    for _ in range(2000):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+        assert normalize_text(text) == normalize_text_nfkd(text), repr(text)
+
+
+def test_typographic_characters_are_folded():
+    assert normalize_text("don\u2019t \u201cquote\u201d 2019\u20132021 \ufb01le caf\u00e9") == \
+        "don't \"quote\" 2019-2021 file cafe"
+    assert normalize_text("a\u00a0\u00a0b\u200bc") == "a bc"
+
+
+def test_bullets_become_separators():
+    assert normalize_text("\u2022 Python \u2022 SQL\u2022Go \u2022\n  \u25aa Java") == "Python | SQL | Go\nJava"
+
+
+def test_accented_text_falls_back_to_nfkd():
+    text = "Jos\u00e9 M\u00fcller \u2013 Z\u00fcrich"
+    assert normalize_text(text) == "Jose Muller - Zurich"
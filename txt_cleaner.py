@@ -1,16 +1,183 @@
+import codecs
 import unicodedata
 import re
 
+from offset_map import apply_edits
+
+# Stands in for bullets between encoding to ASCII and _bullet_edits. A BEL
+# already in the text is read as a space so it isn't taken for a bullet.
+_BULLET_MARK = '\x07'
+# Typographic characters folded before NFKD, which alone drops quotes,
+# dashes and bullets and so glues "2019–2021" and "Python•SQL" together
+_TYPOGRAPHIC = str.maketrans({
+    **dict.fromkeys('‘’‚‛′', "'"),
+    **dict.fromkeys('“”„‟″«»', '"'),
+    **dict.fromkeys('‐‑‒–—―−', '-'),
+    **dict.fromkeys('\u00a0\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a'
+                    '\u202f\u205f\u3000', ' '),
+    **dict.fromkeys('\u200b\u200c\u200d\u2060\ufeff\u00ad', None),
+    **dict.fromkeys('•‣⁃∙·▪▫■□●○◦'
+                    '►▸➢➤✓✔❖\uf0a7\uf0b7', _BULLET_MARK),
+    '…': '...',
+    'ﬀ': 'ff', 'ﬁ': 'fi', 'ﬂ': 'fl', 'ﬃ': 'ffi', 'ﬄ': 'ffl',
+    'ﬅ': 'st', 'ﬆ': 'st',
+})
+
+_NON_ASCII = re.compile(r'[^\x00-\x7f]+')
+# Same as [ ]{2,}, but the literal prefix lets the engine skip ahead
+_SPACES = re.compile(r'  +')
+
+def _fold_run(run):
+    """ASCII for a run of non-ASCII characters."""
+    run = run.translate(_TYPOGRAPHIC)
+    if not run.isascii():
+        # NFKD only splits characters into base + combining marks and the
+        # marks are dropped as non-ASCII, so a run folds on its own
+        run = unicodedata.normalize('NFKD', run).encode('ascii', 'ignore').decode('ascii')
+    return run
+
+def _fold_error(error):
+    """Codec error handler for _fold_run."""
+    return _fold_run(error.object[error.start:error.end]), error.end
+
+codecs.register_error('txt_cleaner.fold', _fold_error)
+
+def _bullet_edits(text):
+    """
+    (start, end, replacement) for every run of bullets and the whitespace
+    around it. A run at either end of its line is a list marker and is
+    dropped; between items it becomes a separator ("Python • SQL" -> "Python | SQL").
+    """
+    line_start = line_end = 0
+    pos = 0
+    mark = text.find(_BULLET_MARK)
+    while mark >= 0:
+        if mark >= line_end:
+            line_start = text.rfind('\n', 0, mark) + 1
+            line_end = text.find('\n', mark)
+            if line_end < 0:
+                line_end = len(text)
+            pos = line_start
+        start = mark
+        while start > pos and text[start - 1].isspace():
+            start -= 1
+        end = mark + 1
+        while end < line_end and (text[end] == _BULLET_MARK or text[end].isspace()):
+            end += 1
+        yield start, end, '' if start == line_start or end == line_end else ' | '
+        pos = end
+        mark = text.find(_BULLET_MARK, end)
+
+def _apply(text, edits):
+    parts = []
+    pos = 0
+    for start, end, replacement in edits:
+        parts.append(text[pos:start])
+        parts.append(replacement)
+        pos = end
+    parts.append(text[pos:])
+    return ''.join(parts)
+
+def _to_ascii(text):
+    if _BULLET_MARK in text:
+        text = text.replace(_BULLET_MARK, ' ')
+    if text.isascii():
+        return text
+    # The encoder skips ASCII at C speed and only calls _fold_error for the
+    # non-ASCII runs
+    text = text.encode('ascii', 'txt_cleaner.fold').decode('ascii')
+    if _BULLET_MARK in text:
+        text = _apply(text, _bullet_edits(text))
+    return text
+
+def _tabs_to_spaces(text):
+    # Tabs and carriage returns become spaces; a run of them turns into a run
+    # of spaces, which the collapse below reduces to one like [\t\r]+ did
+    if '\t' in text:
+        text = text.replace('\t', ' ')
+    if '\r' in text:
+        text = text.replace('\r', ' ')
+    return text
+
+def _collapse_spaces(text):
+    # Collapse multiple horizontal spaces (but preserve newlines \n)
+    return _SPACES.sub(' ', _tabs_to_spaces(text))
+
 def normalize_text(text):
-    # Normalize Unicode (accents → ASCII)
-    text = unicodedata.normalize('NFKD', text)
-    text = text.encode('ascii', 'ignore').decode('ascii')
-    
-    # Remove tabs and carriage returns, replace with a single space
-    text = re.sub(r'[\t\r]+', ' ', text)
+    # Normalize Unicode (typographic characters, accents → ASCII); ASCII text is left as is
+    text = _to_ascii(text)
     
-    # Collapse multiple horizontal spaces (but preserve newlines \n)
-    text = re.sub(r'[ ]{2,}', ' ', text).strip()
+    # Remove tabs and carriage returns, collapse multiple horizontal spaces
+    text = _collapse_spaces(text).strip()
     
     # It is important NOT to use r'\s+' here, as it includes '\n'
-    return text
\ No newline at end of file
+    return text
+
+def normalize_text_with_offsets(text):
+    """
+    normalize_text plus the OffsetMap from the normalized text back to
+    `text`. Slower than normalize_text: every step records its edits.
+    """
+    text = text.replace(_BULLET_MARK, ' ')
+    text, folded = apply_edits(text, ((match.start(), match.end(), _fold_run(match.group()))
+                                      for match in _NON_ASCII.finditer(text)))
+    text, bullets = apply_edits(text, _bullet_edits(text))
+    text = _tabs_to_spaces(text)
+    text, spaces = apply_edits(text, ((match.start(), match.end(), ' ') for match in _SPACES.finditer(text)))
+    body = text.lstrip()
+    lead = len(text) - len(body)
+    body = body.rstrip()
+    text, stripped = apply_edits(text, [edit for edit in [(0, lead, ''), (lead + len(body), len(text), '')]
+                                        if edit[1] > edit[0]])
+    return text, folded.compose(bullets).compose(spaces).compose(stripped)
+
+def normalize_text_nfkd(text):
+    """The original NFKD-only normalization, kept as the reference for benchmarks."""
+    text = unicodedata.normalize('NFKD', text)
+    text = text.encode('ascii', 'ignore').decode('ascii')
+    text = re.sub(r'[\t\r]+', ' ', text)
+    return re.sub(r'[ ]{2,}', ' ', text).strip()
+
+# Bullets are folded by line, so the incomplete last line of a chunk is held
+# back until its newline arrives, up to this many characters
+STREAM_MAX_LINE = 1024 * 1024
+
+def _complete_lines(chunks):
+    # Pieces of the incomplete last line, joined once when it is complete
+    # rather than copied again with every chunk that extends it
+    held, held_len = [], 0
+    for chunk in chunks:
+        cut = chunk.rfind('\n') + 1
+        if cut == 0:
+            held.append(chunk)
+            held_len += len(chunk)
+            if held_len > STREAM_MAX_LINE:
+                yield ''.join(held)
+                held, held_len = [], 0
+            continue
+        held.append(chunk[:cut])
+        yield ''.join(held)
+        held, held_len = [chunk[cut:]], len(chunk) - cut
+    partial = ''.join(held)
+    if partial:
+        yield partial
+
+def iter_normalize_text(chunks):
+    """
+    Streaming normalize_text: yields cleaned pieces of the concatenated
+    chunks. Trailing whitespace of each chunk is held back until it is known
+    whether more text follows, so runs of spaces and tabs across a boundary
+    still collapse and the joined output equals normalize_text(''.join(chunks))
+    unless a line is longer than STREAM_MAX_LINE characters.
+    """
+    pending = ''
+    started = False
+    for chunk in _complete_lines(chunks):
+        text = pending + _to_ascii(chunk)
+        if not started:
+            text = text.lstrip()
+        body = text.rstrip()
+        pending = text[len(body):]
+        if body:
+            started = True
+            yield _collapse_spaces(body)